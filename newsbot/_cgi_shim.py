@@ -0,0 +1,73 @@
+"""
+Compatibility fix for the cgi module, removed from the standard library in Python 3.13.
+googletrans (through httpx) still imports cgi.parse_header. On Python 3.13+ the
+legacy-cgi package from requirements.txt provides the module; if it is missing,
+a minimal shim is installed instead.
+
+Import this module before googletrans:
+    import _cgi_shim  # noqa: F401
+"""
+import sys
+from email.message import Message
+from email.utils import collapse_rfc2231_value
+
+
+def _split_params(line):
+    """Split a header at each ';' outside a quoted string, like cgi._parseparam."""
+    s = ';' + line
+    while s[:1] == ';':
+        s = s[1:]
+        end = s.find(';')
+        while end > 0 and (s.count('"', 0, end) - s.count('\\"', 0, end)) % 2:
+            end = s.find(';', end + 1)
+        if end < 0:
+            end = len(s)
+        yield s[:end].strip()
+        s = s[end:]
+
+
+def _parse_header(line):
+    """
+    Parse a Content-Type like header into (value, params), like cgi.parse_header.
+    The main value always matches cgi's, and so do the parameters of well-formed
+    headers. Malformed parameters (an empty name, stray '*' or quotes) can come out
+    differently, and RFC 2231 values are decoded where cgi returns them raw.
+    """
+    parts = list(_split_params(line))
+    message = Message()
+    message['content-type'] = line
+    # The main value is kept exactly as cgi returns it; Message is only used for the
+    # parameters, which it unquotes and RFC 2231 decodes (filename*=, filename*0=)
+    # under their base name. cgi drops parameters without '=' ("a; b"), which
+    # Message reports with an empty value.
+    assigned = {
+        part.split('=', 1)[0].split('*', 1)[0].strip().lower()
+        for part in parts[1:] if '=' in part
+    }
+    return parts[0], {
+        name: collapse_rfc2231_value(value)
+        for name, value in (message.get_params() or [])[1:] if name in assigned
+    }
+
+
+try:
+    import cgi
+    # cgi exists (stdlib before 3.13, or legacy-cgi) - make sure parse_header is usable
+    if not callable(getattr(cgi, 'parse_header', None)):
+        cgi.parse_header = _parse_header
+except ImportError:
+    # Create a minimal cgi module shim for compatibility (Python 3.13+ without legacy-cgi)
+    from urllib.parse import parse_qs, unquote
+    
+    class cgi:
+        @staticmethod
+        def parse_qs(qs, keep_blank_values=False, strict_parsing=False):
+            return parse_qs(qs, keep_blank_values=keep_blank_values, strict_parsing=strict_parsing)
+        
+        @staticmethod
+        def unquote(s):
+            return unquote(s)
+        
+        parse_header = staticmethod(_parse_header)
+    
+    sys.modules['cgi'] = cgi
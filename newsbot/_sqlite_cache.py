@@ -0,0 +1,75 @@
+"""
+Small SQLite store shared by the on-disk caches (OpenAI summaries, translations,
+scraped articles). Each cache supplies its database path and table schema; the
+database is opened on first use and shared by all threads behind one lock.
+
+Caches are only an optimization: if the database cannot be opened the cache is
+disabled for the rest of the process, and failed reads or writes are ignored.
+"""
+import logging
+import os
+import sqlite3
+import threading
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+class SQLiteCache:
+    """Lazily opened SQLite database holding one cache table."""
+    
+    def __init__(self, path: str, schema: str):
+        """
+        Args:
+            path: Database file; an empty string disables the cache
+            schema: CREATE TABLE IF NOT EXISTS statement for the cache table
+        """
+        self.path = path
+        self.schema = schema
+        self._conn = None
+        self._lock = threading.Lock()
+    
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        """Open the database on first use (must be called with _lock held)."""
+        if self._conn is None:
+            self._conn = False
+            if self.path:
+                try:
+                    directory = os.path.dirname(self.path)
+                    if directory:
+                        os.makedirs(directory, exist_ok=True)
+                    conn = sqlite3.connect(self.path, check_same_thread=False)
+                    conn.execute('PRAGMA journal_mode=WAL')
+                    conn.execute(self.schema)
+                    self._conn = conn
+                except (OSError, sqlite3.Error) as e:
+                    logger.warning(f"Cache disabled, could not open {self.path}: {e}")
+        return self._conn or None
+    
+    def fetchone(self, sql: str, params=()) -> Optional[tuple]:
+        """
+        Run a query and return its first row.
+        
+        Returns:
+            The row, or None on a miss (or when the cache is disabled or fails)
+        """
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return None
+            try:
+                return conn.execute(sql, params).fetchone()
+            except sqlite3.Error:
+                return None
+    
+    def execute(self, sql: str, params=()):
+        """Run a write statement and commit it; errors are ignored."""
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return
+            try:
+                with conn:
+                    conn.execute(sql, params)
+            except sqlite3.Error:
+                pass
@@ -5,71 +5,18 @@ Fetches news from scrape_news.py, generates full news articles in Bangla using O
 """
 
 # Compatibility fix for Python 3.13+ where cgi module was removed
-# googletrans may try to import cgi.parse_header, so we provide a shim
-def _create_parse_header():
-    """Create parse_header function for cgi compatibility."""
-    def parse_header(line):
-        """Parse a Content-Type like header."""
-        if ';' in line:
-            main, params = line.split(';', 1)
-            main = main.strip()
-            param_dict = {}
-            for param in params.split(';'):
-                if '=' in param:
-                    key, value = param.split('=', 1)
-                    param_dict[key.strip()] = value.strip().strip('"\'')
-            return main, param_dict
-        return line.strip(), {}
-    return parse_header
-
-try:
-    import cgi
-    # cgi exists but may be deprecated - that's fine
-    # Ensure parse_header exists (some Python versions may not have it accessible)
-    if not hasattr(cgi, 'parse_header'):
-        cgi.parse_header = _create_parse_header()
-    # Also ensure it's callable (in case of access issues)
-    if not callable(getattr(cgi, 'parse_header', None)):
-        cgi.parse_header = _create_parse_header()
-except ImportError:
-    # Create a minimal cgi module shim for compatibility (Python 3.13+)
-    import sys
-    from urllib.parse import parse_qs, unquote
-    
-    class cgi:
-        @staticmethod
-        def parse_qs(qs, keep_blank_values=False, strict_parsing=False):
-            return parse_qs(qs, keep_blank_values=keep_blank_values, strict_parsing=strict_parsing)
-        
-        @staticmethod
-        def unquote(s):
-            return unquote(s)
-        
-        @staticmethod
-        def parse_header(line):
-            """Parse a Content-Type like header."""
-            if ';' in line:
-                main, params = line.split(';', 1)
-                main = main.strip()
-                param_dict = {}
-                for param in params.split(';'):
-                    if '=' in param:
-                        key, value = param.split('=', 1)
-                        param_dict[key.strip()] = value.strip().strip('"\'')
-                return main, param_dict
-            return line.strip(), {}
-    
-    sys.modules['cgi'] = cgi
-    # Also set parse_header as a module-level function for compatibility
-    cgi.parse_header = _create_parse_header()
+# googletrans may try to import cgi.parse_header, so install the shim first
+import _cgi_shim  # noqa: F401
 
 import json
 import os
 import requests
-from googletrans import Translator
 from datetime import datetime
 import logging
 from scrape_news import scrape_news
+from translation import (
+    cache_translation, get_cached_translation, get_translator, normalize_whitespace, translate_with_retry
+)
 
 # Setup logging
 logging.basicConfig(
@@ -78,8 +25,8 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Initialize translator
-translator = Translator()
+# Initialize translator (shared with the other modules that translate)
+translator = get_translator()
 
 # File paths
 POSTED_DB_FILE = os.path.join(os.path.dirname(__file__), 'posted.json')
@@ -198,14 +145,19 @@ def translate_text(text, dest='bn', use_openai=True):
     # Fallback to googletrans (free, but lower quality)
     try:
         # Remove extra whitespace
-        text = ' '.join(text.split())
+        text = normalize_whitespace(text)
         # Limit text length to avoid API issues
         if len(text) > 8000:
             text = text[:8000]
         
-        result = translator.translate(text, dest=dest)
+        cached = get_cached_translation(text, dest)
+        if cached is not None:
+            return cached
+        
+        translated = translate_with_retry(translator, text, dest)
         logger.debug("Title translated using googletrans (fallback)")
-        return result.text
+        cache_translation(text, dest, translated)
+        return translated
     except Exception as e:
         logger.warning(f"Translation failed: {e}")
         return text  # Return original if translation fails
@@ -1,10 +1,16 @@
 import requests
 from bs4 import BeautifulSoup
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from itertools import islice
 import time
 import json
 import os
+import threading
+from urllib.parse import urlparse
 from summarizer import create_summarizer
+from _sqlite_cache import SQLiteCache
 
 # Load configuration
 CONFIG_FILE = os.path.join(os.path.dirname(__file__), 'config.json')
@@ -93,6 +99,13 @@ def _get_summarizer():
             return None
     return _summarizer
 
+def _preload_summarizer(summarizer):
+    """Load summarizer models in the background (see SummaryGenerator.preload)."""
+    try:
+        summarizer.preload()
+    except Exception as e:
+        print(f"Warning: Summarizer preload failed: {e}. Models will load on first use.")
+
 HEADERS = {
     "User-Agent": (
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
@@ -100,17 +113,75 @@ HEADERS = {
     )
 }
 
-def fetch_html(url):
-    """Fetch HTML content from URL with error handling."""
-    time.sleep(1.5)  # polite delay
+# Minimum seconds between two requests to the same host. The worker threads share
+# one schedule, so concurrent fetches are spaced out instead of arriving together.
+POLITE_DELAY = 1.5
+_host_lock = threading.Lock()
+_host_last_request = {}  # host -> time.monotonic() its latest request was scheduled for
+
+def _wait_for_host(url):
+    """Sleep until url's host may be sent another request, and claim that slot."""
+    host = urlparse(url).netloc
+    with _host_lock:
+        now = time.monotonic()
+        last = _host_last_request.get(host)
+        slot = now if last is None else max(now, last + POLITE_DELAY)
+        _host_last_request[host] = slot
+    # Sleep outside the lock so fetches from other hosts are not held up
+    time.sleep(slot - now)
+
+def fetch_html_conditional(url, etag=None, last_modified=None):
+    """
+    Fetch a page, asking the server to skip the body if it has not changed.
+    Without etag or last_modified this is a plain GET (see fetch_html).
+    
+    Returns:
+        (html, etag, last_modified); html is None if the server answered 304 Not Modified
+    """
+    headers = dict(HEADERS)
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+    
+    _wait_for_host(url)  # polite delay, shared by all worker threads
     try:
-        resp = requests.get(url, headers=HEADERS, timeout=15)
+        resp = requests.get(url, headers=headers, timeout=15)
+        if resp.status_code == 304:
+            return None, etag, last_modified
         resp.raise_for_status()
-        return resp.text
+        return resp.text, resp.headers.get("ETag"), resp.headers.get("Last-Modified")
     except requests.exceptions.RequestException as e:
         print(f"Error fetching {url}: {e}")
         raise
 
+def fetch_html(url):
+    """Fetch HTML content from URL with error handling."""
+    html, _, _ = fetch_html_conditional(url)
+    return html
+
+# On-disk cache of scraped articles. Cached pages are revalidated with their
+# ETag / Last-Modified, so an unchanged article is neither downloaded nor parsed again.
+CACHE_DIR = os.path.join(os.path.dirname(__file__), '.scrape_cache')
+_cache = SQLiteCache(
+    os.path.join(CACHE_DIR, 'articles.db'),
+    "CREATE TABLE IF NOT EXISTS articles ("
+    "url TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, scraped_at TEXT, title_sv TEXT, content_sv TEXT)"
+)
+
+def _load_cached_article(url):
+    """Return the cached (etag, last_modified, title, content) row for url, or None."""
+    return _cache.fetchone(
+        "SELECT etag, last_modified, title_sv, content_sv FROM articles WHERE url = ?", (url,)
+    )
+
+def _store_cached_article(url, etag, last_modified, title, content_text):
+    """Save a freshly scraped article; cache errors never fail the scrape."""
+    _cache.execute(
+        "INSERT OR REPLACE INTO articles VALUES (?, ?, ?, ?, ?, ?)",
+        (url, etag, last_modified, datetime.now(timezone.utc).isoformat(), title, content_text)
+    )
+
 def parse_category_page(html, category_name=None):
     """
     Parse category page to extract article links.
@@ -245,7 +316,58 @@ def parse_category_page(html, category_name=None):
 
     return articles[:5]  # limit to latest 5 articles per category
 
-def parse_article_page(url, summarizer=None):
+def _extract_article(html):
+    """
+    Extract the title and cleaned body text from an article page.
+    
+    Returns:
+        (title, content_text); title is None if the page has no <title>
+    """
+    soup = BeautifulSoup(html, "html.parser")
+
+    # --- Title extraction ---
+    # Read from <title> tag in <head> section
+    title_elem = soup.find("title")
+    title = None
+    if title_elem:
+        title = title_elem.get_text(strip=True)
+        # If title contains " | " separator, extract the first part (before the separator)
+        if " | " in title:
+            title = title.split(" | ")[0].strip()
+
+    # Content
+    content_selectors = [
+        ".post-content",
+        ".entry-content",
+        ".single-content",
+        "article"
+    ]
+
+    content_text = ""
+    for sel in content_selectors:
+        container = soup.select_one(sel)
+        if container:
+            paragraphs = [p.get_text(strip=True) for p in container.find_all("p")]
+            content_text = "\n".join(paragraphs)
+            break
+
+    # Clean content: remove common noise
+    if content_text:
+        import re
+        # Remove date patterns like "2025 12 08" (standalone lines)
+        content_text = re.sub(r'^\d{4}[\s\-]\d{1,2}[\s\-]\d{1,2}\s*$', '', content_text, flags=re.MULTILINE)
+        content_text = re.sub(r'\n\d{4}[\s\-]\d{1,2}[\s\-]\d{1,2}\n', '\n', content_text)
+        # Remove author bylines and metadata (common patterns)
+        content_text = re.sub(r'^.*?(?:Text:|Foto:|Foto:|Bild:).*?$', '', content_text, flags=re.MULTILINE | re.IGNORECASE)
+        # Remove "LÄS MER:" links and similar
+        content_text = re.sub(r'LÄS MER:.*$', '', content_text, flags=re.MULTILINE | re.IGNORECASE)
+        # Remove excessive newlines
+        content_text = re.sub(r'\n{3,}', '\n\n', content_text)
+        content_text = content_text.strip()
+
+    return title, content_text
+
+def parse_article_page(url, summarizer=None, use_cache=False):
     """
     Parse individual article page to extract content and generate summary.
     
@@ -253,6 +375,7 @@ def parse_article_page(url, summarizer=None):
         url: Article URL to parse
         summarizer: SummaryGenerator instance (optional, uses default if not provided)
                     Follows Dependency Inversion Principle - accepts abstraction
+        use_cache: Reuse the cached title/content when the page is unchanged (see CACHE_DIR)
         
     Returns:
         Dictionary with title, content, and summary
@@ -261,48 +384,18 @@ def parse_article_page(url, summarizer=None):
         summarizer = _get_summarizer()
     
     try:
-        html = fetch_html(url)
-        soup = BeautifulSoup(html, "html.parser")
-
-        # --- Title extraction ---
-        # Read from <title> tag in <head> section
-        title_elem = soup.find("title")
-        title = None
-        if title_elem:
-            title = title_elem.get_text(strip=True)
-            # If title contains " | " separator, extract the first part (before the separator)
-            if " | " in title:
-                title = title.split(" | ")[0].strip()
-
-        # Content
-        content_selectors = [
-            ".post-content",
-            ".entry-content",
-            ".single-content",
-            "article"
-        ]
-
-        content_text = ""
-        for sel in content_selectors:
-            container = soup.select_one(sel)
-            if container:
-                paragraphs = [p.get_text(strip=True) for p in container.find_all("p")]
-                content_text = "\n".join(paragraphs)
-                break
-
-        # Clean content: remove common noise
-        if content_text:
-            import re
-            # Remove date patterns like "2025 12 08" (standalone lines)
-            content_text = re.sub(r'^\d{4}[\s\-]\d{1,2}[\s\-]\d{1,2}\s*$', '', content_text, flags=re.MULTILINE)
-            content_text = re.sub(r'\n\d{4}[\s\-]\d{1,2}[\s\-]\d{1,2}\n', '\n', content_text)
-            # Remove author bylines and metadata (common patterns)
-            content_text = re.sub(r'^.*?(?:Text:|Foto:|Foto:|Bild:).*?$', '', content_text, flags=re.MULTILINE | re.IGNORECASE)
-            # Remove "LÄS MER:" links and similar
-            content_text = re.sub(r'LÄS MER:.*$', '', content_text, flags=re.MULTILINE | re.IGNORECASE)
-            # Remove excessive newlines
-            content_text = re.sub(r'\n{3,}', '\n\n', content_text)
-            content_text = content_text.strip()
+        if use_cache:
+            cached = _load_cached_article(url)
+            etag, last_modified = (cached[0], cached[1]) if cached else (None, None)
+            html, etag, last_modified = fetch_html_conditional(url, etag, last_modified)
+            if html is None and cached:
+                # Not modified since it was cached: skip parsing too
+                title, content_text = cached[2], cached[3]
+            else:
+                title, content_text = _extract_article(html)
+                _store_cached_article(url, etag, last_modified, title, content_text)
+        else:
+            title, content_text = _extract_article(fetch_html(url))
 
         # Generate news article or summary using AI
         # If output_language is 'bn', generates full news article in Bangla
@@ -340,33 +433,101 @@ def parse_article_page(url, summarizer=None):
             "summary_sv": ""
         }
 
-def scrape_news():
+# Default number of pages fetched at once. All URLs usually point at the same site,
+# so keep this modest; requests to one host are still spaced POLITE_DELAY apart.
+DEFAULT_MAX_WORKERS = 4
+
+def _fetch_listing(url):
     """
-    Scrape articles from a list of URLs or categories.
-    Supports both URL-based scraping (new) and category-based scraping (backward compatible).
+    Fetch one listing URL (or category page) and return its article stubs.
+    Returns an empty list if the page cannot be fetched.
     """
+    # Extract category/source name from URL for metadata
+    if USE_URLS:
+        # Extract name from URL (e.g., "sverige" from "https://marcusoscarsson.se/sverige/")
+        url_parts = url.rstrip('/').split('/')
+        source_name = url_parts[-1].capitalize() if url_parts else "News"
+        print(f"Fetching articles from URL: {url}")
+    else:
+        # Legacy category-based: extract category name from URL
+        source_name = url.split('/category/')[-1].rstrip('/').capitalize() if '/category/' in url else "News"
+        print(f"Fetching articles from category: {source_name}")
+    
+    try:
+        page_html = fetch_html(url)
+        return parse_category_page(page_html, category_name=source_name)
+    except Exception as e:
+        print(f"Error fetching URL {url}: {e}")
+        return []
+
+def _scrape_article(art, use_cache=False):
+    """Scrape one article page and merge it with its listing metadata."""
+    print(f"Scraping article: {art['url']}")
+    detail = parse_article_page(art["url"], use_cache=use_cache)
+
+    return {
+        **art,
+        **detail,
+        "scraped_at": datetime.now(timezone.utc).isoformat()
+    }
+
+def _list_articles(max_workers):
+    """Fetch every listing page and return the article stubs in configured order."""
     all_articles = []
     
-    # Fetch articles from each URL
-    for url in SCRAPE_URLS:
-        # Extract category/source name from URL for metadata
-        if USE_URLS:
-            # Extract name from URL (e.g., "sverige" from "https://marcusoscarsson.se/sverige/")
-            url_parts = url.rstrip('/').split('/')
-            source_name = url_parts[-1].capitalize() if url_parts else "News"
-            print(f"Fetching articles from URL: {url}")
-        else:
-            # Legacy category-based: extract category name from URL
-            source_name = url.split('/category/')[-1].rstrip('/').capitalize() if '/category/' in url else "News"
-            print(f"Fetching articles from category: {source_name}")
-        
-        try:
-            page_html = fetch_html(url)
-            articles = parse_category_page(page_html, category_name=source_name)
+    # Warm up the summarizer while the listing pages download
+    summarizer = _get_summarizer()
+    if summarizer is not None:
+        threading.Thread(target=_preload_summarizer, args=(summarizer,), daemon=True).start()
+    
+    # Fetch articles from each URL (map keeps the configured URL order)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for articles in executor.map(_fetch_listing, SCRAPE_URLS):
             all_articles.extend(articles)
-        except Exception as e:
-            print(f"Error fetching URL {url}: {e}")
-            continue
+    
+    return all_articles
+
+def _scrape_articles_iter(all_articles, max_workers, use_cache):
+    """
+    Scrape article pages concurrently, yielding them in order.
+    At most max_workers pages are in flight, so a consumer that stops early
+    leaves the remaining articles unfetched.
+    """
+    stubs = iter(all_articles)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = deque(
+            executor.submit(_scrape_article, art, use_cache) for art in islice(stubs, max_workers)
+        )
+        while pending:
+            merged = pending.popleft().result()
+            # Keep the pool busy while the caller handles this article
+            for art in islice(stubs, 1):
+                pending.append(executor.submit(_scrape_article, art, use_cache))
+            yield merged
+
+def scrape_news_iter(max_workers=DEFAULT_MAX_WORKERS, use_cache=False):
+    """
+    Yield scraped articles one at a time, in the same order as scrape_news().
+    Use with itertools.islice to scrape only the first N articles.
+    
+    Args:
+        max_workers: Number of pages fetched and parsed concurrently (1 = sequential)
+        use_cache: Revalidate article pages against the on-disk cache instead of
+                   always downloading and parsing them
+    """
+    yield from _scrape_articles_iter(_list_articles(max_workers), max_workers, use_cache)
+
+def scrape_news(max_workers=DEFAULT_MAX_WORKERS, use_cache=False):
+    """
+    Scrape articles from a list of URLs or categories.
+    Supports both URL-based scraping (new) and category-based scraping (backward compatible).
+    
+    Args:
+        max_workers: Number of pages fetched and parsed concurrently (1 = sequential)
+        use_cache: Revalidate article pages against the on-disk cache instead of
+                   always downloading and parsing them
+    """
+    all_articles = _list_articles(max_workers)
     
     # Build metadata
     if USE_URLS:
@@ -381,17 +542,8 @@ def scrape_news():
         "articles": []
     }
 
-    # Process each article
-    for art in all_articles:
-        print(f"Scraping article: {art['url']}")
-        detail = parse_article_page(art["url"])
-
-        merged = {
-            **art,
-            **detail,
-            "scraped_at": datetime.now(timezone.utc).isoformat()
-        }
-        scraped_output["articles"].append(merged)
+    # Process each article; page fetches are I/O-bound, so their waits overlap
+    scraped_output["articles"] = list(_scrape_articles_iter(all_articles, max_workers, use_cache))
 
     return scraped_output
 
@@ -3,8 +3,245 @@ Summary generation module following SOLID principles.
 Provides abstract interface for text summarization.
 """
 from abc import ABC, abstractmethod
-from typing import Optional
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import List, Optional
+import hashlib
+import json
+import logging
 import os
+import re
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from _sqlite_cache import SQLiteCache
+
+try:
+    # Optional: compiled sentence segmenter, much faster than the regex splitter
+    # and aware of abbreviations such as "bl.a."
+    from blingfire import text_to_sentences
+except ImportError:
+    text_to_sentences = None
+
+try:
+    # Optional: faster JSON encoding/decoding for OpenAI requests
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# Characters that terminate a sentence
+_SENT_END = frozenset('.!?')
+
+# Precompiled patterns used by the extractive summarizers (compiled once per process)
+_DATE = r'\d{4}[\s\-]\d{1,2}[\s\-]\d{1,2}'
+# All noise removed by _clean_text, fused into one alternation so the text is scanned once
+_NOISE_RE = re.compile(r'''
+      ^ DATE \s* $              # date on its own line, e.g. "2025 12 08" or "2025-12-08"
+    | \n DATE \s+              # date at the start of a line
+    | \s+ DATE \n              # date at the end of a line
+    | ^ \b\d{4}\b \s* $        # standalone year on its own line
+    | \S+@\S+                  # email address
+    | http[s]?://\S+           # URL
+'''.replace('DATE', _DATE), re.MULTILINE | re.VERBOSE)
+_SENT_SPLIT_RE = re.compile(r'([.!?])\s+')
+_SIMPLE_SPLIT_RE = re.compile(r'[.!?]\s+')
+_DOT_CAP_RE = re.compile(r'\.([A-ZÅÄÖ])')
+# Summary post-processing in one pass: a missing full stop between a lowercase word and
+# a capitalized one ("ord Nästa" -> "ord. Nästa"), or a missing space after punctuation
+# ("slut.Nästa" -> "slut. Nästa"). The punctuation branch only looks ahead so the
+# letter after it can still start a lowercase/capital match.
+_POSTPROC_RE = re.compile(r'([a-zåäö])\s+([A-ZÅÄÖ][a-zåäö])|([.!?])(?=[A-ZÅÄÖa-zåäö])')
+
+
+def _postproc_repl(match) -> str:
+    """Replacement for _POSTPROC_RE matches."""
+    if match.group(1):
+        return f"{match.group(1)}. {match.group(2)}"
+    return match.group(3) + ' '
+
+# Maximum number of OpenAI requests in flight for summarize_many()
+_MAX_CONCURRENT_REQUESTS = 8
+
+# Shared HTTP session for the OpenAI API: keeps TLS connections alive between articles.
+# Only failures to connect are retried. A chat completion POST is not idempotent: after
+# a read error or a 5xx the request may already have run and been billed, so retrying
+# could pay for the same summary twice. Error statuses are handled by the caller.
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=_MAX_CONCURRENT_REQUESTS,
+    max_retries=Retry(total=2, connect=2, read=0, status=0, backoff_factor=0.3)
+))
+
+
+# On-disk cache of OpenAI responses, so re-running over an overlapping feed does not
+# pay for the same article twice. Like the translation cache it is off unless
+# NEWSBOT_SUMMARY_CACHE names a database file. Rows are never evicted; delete the
+# file to clear it.
+SUMMARY_CACHE_FILE = os.environ.get('NEWSBOT_SUMMARY_CACHE', '')
+_cache = SQLiteCache(SUMMARY_CACHE_FILE, 'CREATE TABLE IF NOT EXISTS summaries (key BLOB PRIMARY KEY, value TEXT)')
+
+
+def _cache_key(body: bytes) -> bytes:
+    """Hash an encoded request payload (model, prompt with article text, token limit)."""
+    return hashlib.blake2b(body, digest_size=16).digest()
+
+
+def _json_dumps(data) -> bytes:
+    """
+    Encode a request payload as compact UTF-8 JSON, with orjson when installed.
+    Non-ASCII text is not \\u-escaped, which halves the size of Bangla prompts.
+    """
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def _json_loads(content: bytes):
+    """Decode a JSON response body, with orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _cache_get(key: bytes) -> Optional[str]:
+    """Look up a cached response, or None on a miss."""
+    row = _cache.fetchone('SELECT value FROM summaries WHERE key = ?', (key,))
+    return row[0] if row else None
+
+
+def _cache_put(key: bytes, value: str):
+    """Store a response; failures are ignored since the cache is only an optimization."""
+    _cache.execute('INSERT OR REPLACE INTO summaries (key, value) VALUES (?, ?)', (key, value))
+
+
+def _sentence_pairs(text: str):
+    """
+    Split whitespace-normalized text into (sentence, punctuation) pairs.
+    
+    Args:
+        text: Text with newlines and repeated whitespace already collapsed
+        
+    Returns:
+        Iterator of (sentence, punctuation) tuples; punctuation is '' for a
+        trailing sentence without a terminator, and always '' when blingfire
+        is installed (its sentences keep their own punctuation)
+    """
+    if text_to_sentences is not None:
+        return ((sentence, '') for sentence in text_to_sentences(text).split('\n'))
+    
+    # Regex fallback when blingfire is not installed
+    parts = _SENT_SPLIT_RE.split(text)
+    # Splitting on one capture group always yields an odd count; pad the last sentence
+    parts.append('')
+    return zip(*[iter(parts)] * 2)
+
+
+def _iter_sentence_pairs(text: str):
+    """
+    Lazy variant of _sentence_pairs for callers that stop after a few sentences.
+    The regex path scans only as far as the caller reads, instead of splitting
+    the whole article up front (split() is still faster when every pair is used).
+    """
+    if text_to_sentences is not None:
+        yield from _sentence_pairs(text)
+        return
+    
+    start = 0
+    for match in _SENT_SPLIT_RE.finditer(text):
+        yield text[start:match.start()], match.group(1)
+        start = match.end()
+    yield text[start:], ''
+
+
+def _join_sentences(sentences) -> str:
+    """
+    Join Sumy output sentences into one string, ending each with punctuation.
+    Whitespace inside sentences is left for the caller to normalize in one pass.
+    """
+    parts = [str(sentence).strip() for sentence in sentences]
+    return ' '.join(part if part[-1] in _SENT_END else part + '.' for part in parts if part)
+
+
+def _approx_sentence_count(text: str) -> int:
+    """
+    Cheap upper-bound estimate of the sentence count (abbreviations and
+    decimals only make it larger, so "fits" checks stay conservative).
+    """
+    return text.count('.') + text.count('!') + text.count('?')
+
+
+@lru_cache(maxsize=8)
+def _get_tokenizer(language: str):
+    """
+    Get the Sumy tokenizer for a language, built once per process.
+    Building it loads the NLTK Punkt model, which is the expensive part.
+    """
+    from sumy.nlp.tokenizers import Tokenizer
+    return Tokenizer(language)
+
+
+@lru_cache(maxsize=4)
+def _get_encoding(model: str):
+    """
+    Get the tiktoken encoding for an OpenAI model, loaded once per process.
+    
+    Returns:
+        The encoding, or None if tiktoken is not installed or its BPE file
+        cannot be loaded (it is downloaded on first use)
+    """
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+    try:
+        try:
+            return tiktoken.encoding_for_model(model)
+        except KeyError:
+            # Unknown model name: use the encoding shared by current chat models
+            return tiktoken.get_encoding("cl100k_base")
+    except Exception as e:
+        logger.warning(f"tiktoken encoding unavailable, trimming input by characters: {e}")
+        return None
+
+
+def _trim_to_budget(text: str, max_tokens: int, max_chars: int, model: str) -> str:
+    """
+    Trim text to an input budget, cutting at the last complete sentence.
+    
+    Args:
+        text: Input text
+        max_tokens: Token budget, used when tiktoken is available
+        max_chars: Character budget, used otherwise
+        model: OpenAI model name the tokens are counted for
+        
+    Returns:
+        The text unchanged if it fits, otherwise a prefix ending on a sentence
+        terminator (or ending in "..." if no sentence boundary was found)
+    """
+    encoding = _get_encoding(model)
+    if encoding is not None:
+        tokens = encoding.encode(text)
+        if len(tokens) <= max_tokens:
+            return text
+        text = encoding.decode(tokens[:max_tokens])
+    else:
+        if len(text) <= max_chars:
+            return text
+        text = text[:max_chars]
+    
+    # Drop the partial sentence at the end, unless that would discard most of the text
+    padded = text + ' '
+    cut = max(padded.rfind(punct + ' ') for punct in _SENT_END)
+    if cut > len(text) // 2:
+        return text[:cut + 1]
+    return text + "..."
 
 
 class SummaryGenerator(ABC):
@@ -26,6 +263,84 @@ class SummaryGenerator(ABC):
             Summary text
         """
         pass
+    
+    def summarize_many(self, texts: List[str], max_sentences: int = 3) -> List[str]:
+        """
+        Generate summaries for several texts.
+        
+        Args:
+            texts: Input texts to summarize
+            max_sentences: Maximum number of sentences in each summary
+            
+        Returns:
+            Summaries in the same order as texts
+        """
+        return [self.summarize(text, max_sentences) for text in texts]
+    
+    def preload(self):
+        """
+        Load models ahead of the first summarize() call, so the first article
+        does not pay the start-up cost. Safe to call from a background thread.
+        """
+        pass
+
+
+class _FastLexRank:
+    """
+    Sumy's LexRank with the sentence-similarity graph built by NumPy.
+    Produces the same ranking as LexRankSummarizer, whose pure-Python pairwise
+    cosine loop dominates the cost of extractive summarization.
+    """
+    
+    def __init__(self, lexrank):
+        """
+        Args:
+            lexrank: Configured sumy LexRankSummarizer (stemmer, stop words, threshold)
+        """
+        import numpy
+        self._np = numpy
+        self._lexrank = lexrank
+    
+    def __call__(self, document, sentences_count):
+        """Rank the document's sentences and return the best sentences_count of them."""
+        np = self._np
+        lexrank = self._lexrank
+        sentences = document.sentences
+        
+        sentences_words = [lexrank._to_words_set(sentence) for sentence in sentences]
+        if not sentences_words:
+            return tuple()
+        tf_metrics = lexrank._compute_tf(sentences_words)
+        
+        # Document frequency of every term, counting each sentence once
+        doc_freq = Counter()
+        for words in sentences_words:
+            doc_freq.update(set(words))
+        columns = {term: i for i, term in enumerate(doc_freq)}
+        n = len(sentences_words)
+        idf = np.log(n / (1.0 + np.fromiter(doc_freq.values(), dtype=float, count=len(doc_freq))))
+        
+        # Sentence x term TF-IDF matrix; idf-modified cosine is then one matrix product
+        weights = np.zeros((n, len(columns)))
+        for row, tf in enumerate(tf_metrics):
+            weights[row, [columns[term] for term in tf]] = list(tf.values())
+        weights *= idf
+        norms = np.linalg.norm(weights, axis=1)
+        norm_products = np.outer(norms, norms)
+        similarity = np.divide(
+            weights @ weights.T, norm_products,
+            out=np.zeros((n, n)), where=norm_products > 0
+        )
+        
+        # Threshold into an adjacency matrix and normalize rows by degree
+        matrix = (similarity > lexrank.threshold).astype(float)
+        degrees = matrix.sum(axis=1)
+        degrees[degrees == 0] = 1
+        matrix /= degrees[:, np.newaxis]
+        
+        scores = lexrank.power_method(matrix, lexrank.epsilon)
+        ratings = dict(zip(sentences, scores))
+        return lexrank._get_best_sentences(sentences, sentences_count, ratings)
 
 
 class SumySummaryGenerator(SummaryGenerator):
@@ -44,23 +359,42 @@ class SumySummaryGenerator(SummaryGenerator):
         """
         self.language = language
         self._summarizer = None
-        self._parser = None
-        self._initialize()
+        self._tokenizer = None
+        self._parser_class = None
+        self._initialized = None  # Sumy is loaded on first summarize() call
+        self._init_lock = threading.Lock()
+    
+    def _ensure_initialized(self):
+        """Load Sumy on first use so processes that never summarize skip the import."""
+        if self._initialized is not None:
+            return
+        
+        # preload() may be loading Sumy in another thread; load it only once
+        with self._init_lock:
+            if self._initialized is None:
+                self._initialize()
+    
+    def preload(self):
+        """Import Sumy and load the Punkt tokenizer now rather than on first use."""
+        self._ensure_initialized()
     
     def _initialize(self):
         """Initialize Sumy components lazily to avoid import errors if not installed."""
         try:
             from sumy.parsers.plaintext import PlaintextParser
-            from sumy.nlp.tokenizers import Tokenizer
             # Use LexRank - better quality than LSA for news articles
             from sumy.summarizers.lex_rank import LexRankSummarizer
             
             self._parser_class = PlaintextParser
-            self._tokenizer_class = Tokenizer
-            self._summarizer_class = LexRankSummarizer
+            self._tokenizer = _get_tokenizer(self.language)
+            self._summarizer = _FastLexRank(LexRankSummarizer())
             self._initialized = True
         except ImportError:
             self._initialized = False
+        except LookupError as e:
+            # NLTK tokenizer data for this language is not installed
+            logger.warning(f"Sumy tokenizer unavailable: {e}, using fallback")
+            self._initialized = False
     
     def _clean_text(self, text: str) -> str:
         """
@@ -70,50 +404,32 @@ class SumySummaryGenerator(SummaryGenerator):
         if not text:
             return ""
         
-        import re
-        
-        # Remove common noise patterns
-        # Remove date patterns like "2025 12 08" or "2025-12-08" only if they're standalone
-        # (on their own line or surrounded by whitespace/newlines) to avoid corrupting content
-        # First, remove dates that are on their own line (most common noise pattern)
-        text = re.sub(r'^\d{4}[\s\-]\d{1,2}[\s\-]\d{1,2}\s*$', '', text, flags=re.MULTILINE)
-        text = re.sub(r'\n\d{4}[\s\-]\d{1,2}[\s\-]\d{1,2}\n', '\n', text)
-        text = re.sub(r'\n\d{4}[\s\-]\d{1,2}[\s\-]\d{1,2}\s+', '\n', text)
-        text = re.sub(r'\s+\d{4}[\s\-]\d{1,2}[\s\-]\d{1,2}\n', '\n', text)
-        
-        # Remove standalone year numbers only if they're on their own line
-        # This prevents removing years that are part of sentences like "founded in 2025"
-        text = re.sub(r'^\b\d{4}\b\s*$', '', text, flags=re.MULTILINE)
-        text = re.sub(r'\n\b\d{4}\b\n', '\n', text)
+        # Remove common noise patterns in a single pass:
+        # - date patterns like "2025 12 08" or "2025-12-08" only if they're standalone
+        #   (on their own line or at a line edge) to avoid corrupting content
+        # - standalone year numbers only if they're on their own line, so years that are
+        #   part of sentences like "founded in 2025" are kept
+        # - email addresses and URLs
+        # Matches are replaced by a space; newlines are collapsed below anyway
+        text = _NOISE_RE.sub(' ', text)
         
-        # Remove email addresses
-        text = re.sub(r'\S+@\S+', '', text)
-        
-        # Remove URLs
-        text = re.sub(r'http[s]?://\S+', '', text)
-        
-        # Remove all newline characters and replace with spaces
-        text = text.replace('\n', ' ').replace('\r', ' ')
-        
-        # Remove excessive whitespace
+        # Collapse newlines and excessive whitespace (str.split() treats \n and \r as whitespace)
         text = ' '.join(text.split())
         
         # Ensure sentences end with proper punctuation
         # Split by sentence endings, but preserve the punctuation
-        sentences = re.split(r'([.!?])\s+', text)
         cleaned_sentences = []
         
-        for i in range(0, len(sentences), 2):
-            if i < len(sentences):
-                sentence = sentences[i].strip()
-                if sentence and len(sentence) > 20:
-                    # Add punctuation if missing
-                    if i + 1 < len(sentences) and sentences[i + 1]:
-                        cleaned_sentences.append(sentence + sentences[i + 1])
-                    elif not sentence[-1] in '.!?':
-                        cleaned_sentences.append(sentence + '.')
-                    else:
-                        cleaned_sentences.append(sentence)
+        for sentence, punct in _sentence_pairs(text):
+            sentence = sentence.strip()
+            if sentence and len(sentence) > 20:
+                # Add punctuation if missing
+                if punct:
+                    cleaned_sentences.append(sentence + punct)
+                elif sentence[-1] not in _SENT_END:
+                    cleaned_sentences.append(sentence + '.')
+                else:
+                    cleaned_sentences.append(sentence)
         
         return ' '.join(cleaned_sentences) if cleaned_sentences else text
     
@@ -129,23 +445,26 @@ class SumySummaryGenerator(SummaryGenerator):
         Returns:
             Summary text, or original text if summarization fails
         """
-        if not self._initialized:
-            return self._fallback_summary(text, max_sentences)
-        
-        if not text or not text.strip():
-            return ""
-        
         try:
+            # Loading Sumy can fail in unexpected ways too; fall back like any other error
+            self._ensure_initialized()
+            if not self._initialized:
+                return self._fallback_summary(text, max_sentences)
+            
+            if not text or not text.strip():
+                return ""
+            
             # Clean text first
             cleaned_text = self._clean_text(text)
             if not cleaned_text:
                 return self._fallback_summary(text, max_sentences)
             
+            # Text already fits in the summary: skip parsing and LexRank entirely
+            if _approx_sentence_count(cleaned_text) <= max_sentences:
+                return self._fallback_summary(cleaned_text, max_sentences)
+            
             # Parse text
-            parser = self._parser_class.from_string(
-                cleaned_text,
-                self._tokenizer_class(self.language)
-            )
+            parser = self._parser_class.from_string(cleaned_text, self._tokenizer)
             
             # Calculate optimal sentence count based on document length
             doc_sentences = len(parser.document.sentences)
@@ -157,50 +476,18 @@ class SumySummaryGenerator(SummaryGenerator):
             optimal_sentences = min(max_sentences, max(2, int(doc_sentences * 0.15)))
             
             # Generate summary
-            summarizer = self._summarizer_class()
-            summary_sentences = summarizer(parser.document, optimal_sentences)
+            summary_sentences = self._summarizer(parser.document, optimal_sentences)
+            
+            # Final cleanup in one scan: add missing sentence breaks and spaces after punctuation
+            summary = _POSTPROC_RE.sub(_postproc_repl, _join_sentences(summary_sentences))
             
-            # Join sentences with proper punctuation
-            summary_parts = []
-            for sentence in summary_sentences:
-                sentence_str = str(sentence).strip()
-                if sentence_str:
-                    # Remove all newlines and replace with spaces
-                    sentence_str = sentence_str.replace('\n', ' ').replace('\r', ' ')
-                    # Remove multiple spaces
-                    sentence_str = ' '.join(sentence_str.split())
-                    # Ensure sentence ends with punctuation
-                    if not sentence_str[-1] in '.!?':
-                        sentence_str += '.'
-                    summary_parts.append(sentence_str)
-            
-            # Join with space (sentences already have punctuation)
-            summary = ' '.join(summary_parts)
-            
-            # Remove all newline characters (replace with spaces)
-            summary = summary.replace('\n', ' ').replace('\r', ' ')
-            
-            # Final cleanup: ensure proper spacing and punctuation
-            import re
-            # Add space after dot if missing (before capital letters)
-            summary = re.sub(r'\.([A-ZÅÄÖ])', r'. \1', summary)
-            
-            # Detect sentence boundaries: capital letter after lowercase (likely new sentence)
-            # Add dot before capital letters that start new sentences
-            summary = re.sub(r'([a-zåäö])\s+([A-ZÅÄÖ][a-zåäö])', r'\1. \2', summary)
-            
-            # Ensure proper spacing after all punctuation
-            summary = re.sub(r'([.!?])([A-ZÅÄÖa-zåäö])', r'\1 \2', summary)
-            
-            # Remove multiple spaces
+            # Normalize whitespace (newlines included)
             summary = ' '.join(summary.split())
             
             return summary.strip()
             
         except Exception as e:
             # Fallback to simple summarization on error
-            import logging
-            logger = logging.getLogger(__name__)
             logger.warning(f"Summarization error: {e}, using fallback")
             return self._fallback_summary(text, max_sentences)
     
@@ -218,28 +505,24 @@ class SumySummaryGenerator(SummaryGenerator):
         if not text:
             return ""
         
-        import re
-        
-        # Remove newlines
-        text = text.replace('\n', ' ').replace('\r', ' ')
+        # Collapse newlines and repeated whitespace (str.split() covers \n and \r)
         text = ' '.join(text.split())
         
         # Simple sentence splitting
-        sentences = re.split(r'([.!?])\s+', text)
         summary_parts = []
         
-        for i in range(0, len(sentences), 2):
-            if i < len(sentences):
-                sentence = sentences[i].strip()
-                if sentence and len(sentence) > 20:
-                    # Add punctuation if present in split
-                    if i + 1 < len(sentences) and sentences[i + 1] in '.!?':
-                        sentence += sentences[i + 1]
-                    elif not sentence[-1] in '.!?':
-                        sentence += '.'
-                    summary_parts.append(sentence)
-                    if len(summary_parts) >= max_sentences:
-                        break
+        for sentence, punct in _iter_sentence_pairs(text):
+            sentence = sentence.strip()
+            if sentence and len(sentence) > 20:
+                # Add punctuation if present in split
+                if punct:
+                    sentence += punct
+                elif sentence[-1] not in _SENT_END:
+                    sentence += '.'
+                summary_parts.append(sentence)
+                # Stop reading sentences as soon as the summary is full
+                if len(summary_parts) >= max_sentences:
+                    break
         
         # Join with spaces and ensure proper formatting
         summary = ' '.join(summary_parts)
@@ -249,6 +532,15 @@ class SumySummaryGenerator(SummaryGenerator):
         return summary.strip()
 
 
+@lru_cache(maxsize=8)
+def _get_sumy(language: str) -> SumySummaryGenerator:
+    """
+    Get a shared SumySummaryGenerator for a language.
+    Used by the other generators for text cleaning and as their fallback.
+    """
+    return SumySummaryGenerator(language=language)
+
+
 class OpenAISummaryGenerator(SummaryGenerator):
     """
     Content generation using OpenAI GPT models.
@@ -276,57 +568,42 @@ class OpenAISummaryGenerator(SummaryGenerator):
         if not self.api_key:
             raise ValueError("OpenAI API key required. Set OPENAI_API_KEY environment variable or pass api_key parameter.")
     
-    def summarize(self, text: str, max_sentences: int = 3) -> str:
+    def _build_request(self, text: str, max_sentences: int) -> dict:
         """
-        Generate content using OpenAI GPT.
-        - If output_language is 'bn': Generates full news article in Bangla
-        - Otherwise: Generates summary
+        Build the chat completion payload for one article.
         
         Args:
             text: Input text (Swedish news article)
             max_sentences: Target number of sentences (used for summaries only)
             
         Returns:
-            Full news article in Bangla (if output_language='bn') or summary text
+            JSON payload for the chat completions endpoint
         """
-        if not text or not text.strip():
-            return ""
-        
-        try:
-            import requests
-            
-            # Truncate text if too long (GPT-3.5-turbo has 16k context, but we want to keep it reasonable)
-            # For full articles, allow more content (up to 5000 chars) to ensure comprehensive coverage
-            # For summaries, keep first ~3000 characters
-            if self.output_language == 'bn':
-                # Full article - allow more content for comprehensive news writing
-                if len(text) > 5000:
-                    text = text[:5000] + "..."
-            else:
-                # Summary - less content needed
-                if len(text) > 3000:
-                    text = text[:3000] + "..."
-            
-            # Adjust max_tokens based on output type
-            if self.output_language == 'bn':
-                # For full news articles in Bangla, use more tokens (roughly 100-150 tokens per paragraph)
-                # Default to 800 tokens for a full article (5-8 paragraphs), but allow config override
-                target_tokens = max(self.max_tokens, 800) if self.max_tokens < 800 else self.max_tokens
-            else:
-                # For summaries, use fewer tokens (roughly 50 tokens per sentence)
-                target_tokens = min(self.max_tokens, max_sentences * 50)
-            
-            url = "https://api.openai.com/v1/chat/completions"
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json"
-            }
-            
-            # Build prompt based on output language
-            if self.output_language == 'bn':
-                # Generate full news article directly in Bangla
-                system_message = "You are a professional journalist writing for a Bangla news publication. You write clear, engaging, and professional news articles in Bangla (Bengali) that feel natural and are written by a skilled journalist. Always respond in Bangla (Bengali) language."
-                prompt = f"""নিম্নলিখিত সুইডিশ সংবাদ নিবন্ধটি পড়ুন এবং এটি থেকে একটি সম্পূর্ণ সংবাদ নিবন্ধ বাংলায় লিখুন।
+        # Truncate text if too long (GPT-3.5-turbo has 16k context, but we want to keep it reasonable)
+        # For full articles, allow more content (~1500 tokens / 5000 chars) to ensure comprehensive coverage
+        # For summaries, keep the first ~900 tokens / 3000 characters
+        # Cut at a sentence boundary so the model never sees a half sentence
+        if self.output_language == 'bn':
+            # Full article - allow more content for comprehensive news writing
+            text = _trim_to_budget(text, 1500, 5000, self.model)
+        else:
+            # Summary - less content needed
+            text = _trim_to_budget(text, 900, 3000, self.model)
+        
+        # Adjust max_tokens based on output type
+        if self.output_language == 'bn':
+            # For full news articles in Bangla, use more tokens (roughly 100-150 tokens per paragraph)
+            # Default to 800 tokens for a full article (5-8 paragraphs), but allow config override
+            target_tokens = max(self.max_tokens, 800) if self.max_tokens < 800 else self.max_tokens
+        else:
+            # For summaries, use fewer tokens (roughly 50 tokens per sentence)
+            target_tokens = min(self.max_tokens, max_sentences * 50)
+        
+        # Build prompt based on output language
+        if self.output_language == 'bn':
+            # Generate full news article directly in Bangla
+            system_message = "You are a professional journalist writing for a Bangla news publication. You write clear, engaging, and professional news articles in Bangla (Bengali) that feel natural and are written by a skilled journalist. Always respond in Bangla (Bengali) language."
+            prompt = f"""নিম্নলিখিত সুইডিশ সংবাদ নিবন্ধটি পড়ুন এবং এটি থেকে একটি সম্পূর্ণ সংবাদ নিবন্ধ বাংলায় লিখুন।
 
 নির্দেশনা:
 - একটি পেশাদার সাংবাদিকের মতো লিখুন
@@ -342,10 +619,10 @@ class OpenAISummaryGenerator(SummaryGenerator):
 {text}
 
 বাংলা সংবাদ নিবন্ধ:"""
-            else:
-                # Generate summary in Swedish (default)
-                system_message = "Du är en expert på att sammanfatta nyhetsartiklar på ett engagerande sätt."
-                prompt = f"""Sammanfatta följande nyhetsartikel på ett engagerande och lättläst sätt. 
+        else:
+            # Generate summary in Swedish (default)
+            system_message = "Du är en expert på att sammanfatta nyhetsartiklar på ett engagerande sätt."
+            prompt = f"""Sammanfatta följande nyhetsartikel på ett engagerande och lättläst sätt. 
 Fokusera på de viktigaste punkterna och gör sammanfattningen intressant för läsare.
 Använd klart och tydligt språk.
 
@@ -353,18 +630,55 @@ Artikel:
 {text}
 
 Sammanfattning:"""
+        
+        data = {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": system_message},
+                {"role": "user", "content": prompt}
+            ],
+            "max_tokens": target_tokens,
+            "temperature": 0.6 if self.output_language == 'bn' else 0.7,  # Lower temp for professional articles, creative for summaries
+        }
+        return data
+    
+    def summarize(self, text: str, max_sentences: int = 3) -> str:
+        """
+        Generate content using OpenAI GPT.
+        - If output_language is 'bn': Generates full news article in Bangla
+        - Otherwise: Generates summary
+        
+        Args:
+            text: Input text (Swedish news article)
+            max_sentences: Target number of sentences (used for summaries only)
             
-            data = {
-                "model": self.model,
-                "messages": [
-                    {"role": "system", "content": system_message},
-                    {"role": "user", "content": prompt}
-                ],
-                "max_tokens": target_tokens,
-                "temperature": 0.6 if self.output_language == 'bn' else 0.7,  # Lower temp for professional articles, creative for summaries
+        Returns:
+            Full news article in Bangla (if output_language='bn') or summary text
+        """
+        if not text or not text.strip():
+            return ""
+        
+        # Summaries of tiny articles are the article itself: skip the network roundtrip.
+        # Bangla output always goes to the API since it needs translating.
+        if self.output_language != 'bn':
+            if len(text) < 300 or _approx_sentence_count(text) <= max_sentences:
+                return ' '.join(text.split())
+        
+        try:
+            url = "https://api.openai.com/v1/chat/completions"
+            headers = {
+                "Authorization": f"Bearer {self.api_key}",
+                "Content-Type": "application/json"
             }
+            body = _json_dumps(self._build_request(text, max_sentences))
+            
+            # Same model, prompt and article as an earlier run: reuse its response
+            cache_key = _cache_key(body)
+            cached = _cache_get(cache_key)
+            if cached is not None:
+                return cached
             
-            response = requests.post(url, headers=headers, json=data, timeout=30)
+            response = _SESSION.post(url, headers=headers, data=body, timeout=30)
             
             # Check for specific error codes
             if response.status_code == 401:
@@ -388,24 +702,41 @@ Sammanfattning:"""
             
             response.raise_for_status()
             
-            result = response.json()
+            result = _json_loads(response.content)
             summary = result['choices'][0]['message']['content'].strip()
             
+            _cache_put(cache_key, summary)
             return summary
             
         except ValueError as e:
             # Re-raise ValueError (API key or rate limit issues)
-            import logging
-            logger = logging.getLogger(__name__)
             logger.error(f"OpenAI API error: {e}")
             raise
         except Exception as e:
-            import logging
-            logger = logging.getLogger(__name__)
             logger.error(f"OpenAI summarization error: {e}")
             # Fallback to extractive method
-            fallback = SumySummaryGenerator(language='sv')
+            fallback = _get_sumy('sv')
             return fallback.summarize(text, max_sentences)
+    
+    def summarize_many(self, texts: List[str], max_sentences: int = 3) -> List[str]:
+        """
+        Generate content for several articles concurrently.
+        Each request is network-bound, so up to _MAX_CONCURRENT_REQUESTS run at once
+        over the shared keep-alive session instead of one after another.
+        
+        Args:
+            texts: Input texts (Swedish news articles)
+            max_sentences: Target number of sentences (used for summaries only)
+            
+        Returns:
+            Generated content in the same order as texts
+        """
+        if len(texts) < 2:
+            return super().summarize_many(texts, max_sentences)
+        
+        workers = min(_MAX_CONCURRENT_REQUESTS, len(texts))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(lambda text: self.summarize(text, max_sentences), texts))
 
 
 class HuggingFaceSummaryGenerator(SummaryGenerator):
@@ -432,12 +763,24 @@ class HuggingFaceSummaryGenerator(SummaryGenerator):
         self._model = None
         self._tokenizer = None
         self._initialized = False
+        self._init_lock = threading.Lock()
+    
+    def preload(self):
+        """Download/load the transformer model now rather than on first use."""
+        self._initialize()
     
     def _initialize(self):
         """Lazy initialization of model and tokenizer."""
         if self._initialized:
             return
         
+        # preload() may be loading the model in another thread; load it only once
+        with self._init_lock:
+            if not self._initialized:
+                self._load_model()
+    
+    def _load_model(self):
+        """Load the summarization pipeline (called once, under _init_lock)."""
         try:
             from transformers import pipeline, AutoTokenizer, AutoModelForSeq2SeqLM
             
@@ -465,8 +808,6 @@ class HuggingFaceSummaryGenerator(SummaryGenerator):
                 "transformers library not installed. Install with: pip install transformers torch"
             )
         except Exception as e:
-            import logging
-            logger = logging.getLogger(__name__)
             logger.error(f"Failed to initialize Hugging Face model: {e}")
             raise
     
@@ -509,11 +850,9 @@ class HuggingFaceSummaryGenerator(SummaryGenerator):
             return summary
             
         except Exception as e:
-            import logging
-            logger = logging.getLogger(__name__)
             logger.error(f"Hugging Face summarization error: {e}")
             # Fallback to extractive method
-            fallback = SumySummaryGenerator(language='sv')
+            fallback = _get_sumy('sv')
             return fallback.summarize(text, max_sentences)
 
 
@@ -530,15 +869,17 @@ class TextRankSummaryGenerator(SummaryGenerator):
         self._parser = None
         self._initialized = False
     
+    def preload(self):
+        """Warm the LexRank generator that summarize() currently delegates to."""
+        _get_sumy(self.language).preload()
+    
     def _initialize(self):
         """Initialize TextRank components."""
         try:
             from sumy.parsers.plaintext import PlaintextParser
-            from sumy.nlp.tokenizers import Tokenizer
             from sumy.summarizers.text_rank import TextRankSummarizer
             
             self._parser_class = PlaintextParser
-            self._tokenizer_class = Tokenizer
             self._summarizer_class = TextRankSummarizer
             self._initialized = True
         except ImportError:
@@ -548,7 +889,7 @@ class TextRankSummaryGenerator(SummaryGenerator):
         """Generate summary using TextRank algorithm."""
         if not self._initialized:
             # Fallback to LexRank
-            fallback = SumySummaryGenerator(language=self.language)
+            fallback = _get_sumy(self.language)
             return fallback.summarize(text, max_sentences)
         
         if not text or not text.strip():
@@ -556,7 +897,7 @@ class TextRankSummaryGenerator(SummaryGenerator):
         
         try:
             # Reuse cleaning logic from SumySummaryGenerator
-            base_generator = SumySummaryGenerator(language=self.language)
+            base_generator = _get_sumy(self.language)
             cleaned_text = base_generator._clean_text(text)
             
             if not cleaned_text:
@@ -564,7 +905,7 @@ class TextRankSummaryGenerator(SummaryGenerator):
             
             parser = self._parser_class.from_string(
                 cleaned_text,
-                self._tokenizer_class(self.language)
+                _get_tokenizer(self.language)
             )
             
             doc_sentences = len(parser.document.sentences)
@@ -576,30 +917,14 @@ class TextRankSummaryGenerator(SummaryGenerator):
             summarizer = self._summarizer_class()
             summary_sentences = summarizer(parser.document, optimal_sentences)
             
-            summary_parts = []
-            for sentence in summary_sentences:
-                sentence_str = str(sentence).strip()
-                if sentence_str:
-                    sentence_str = sentence_str.replace('\n', ' ').replace('\r', ' ')
-                    sentence_str = ' '.join(sentence_str.split())
-                    if not sentence_str[-1] in '.!?':
-                        sentence_str += '.'
-                    summary_parts.append(sentence_str)
-            
-            summary = ' '.join(summary_parts)
-            summary = summary.replace('\n', ' ').replace('\r', ' ')
-            
-            import re
-            summary = re.sub(r'\.([A-ZÅÄÖ])', r'. \1', summary)
+            summary = _DOT_CAP_RE.sub(r'. \1', _join_sentences(summary_sentences))
             summary = ' '.join(summary.split())
             
             return summary.strip()
             
         except Exception as e:
-            import logging
-            logger = logging.getLogger(__name__)
             logger.warning(f"TextRank summarization error: {e}")
-            fallback = SumySummaryGenerator(language=self.language)
+            fallback = _get_sumy(self.language)
             return fallback.summarize(text, max_sentences)
 
 
@@ -654,9 +979,22 @@ class SimpleSummaryGenerator(SummaryGenerator):
         if not text:
             return ""
         
-        import re
-        sentences = re.split(r'[.!?]\s+', text)
+        sentences = _SIMPLE_SPLIT_RE.split(text)
         sentences = [s.strip() for s in sentences if s.strip()]
         
         summary_sentences = sentences[:max_sentences]
-        return " ".join(summary_sentences)
\ No newline at end of file
+        return " ".join(summary_sentences)
+
+
+def _prewarm():
+    """Load the default Swedish Sumy generator in the background."""
+    try:
+        _get_sumy('sv').preload()
+    except Exception as e:
+        logger.warning(f"Summarizer prewarm failed: {e}")
+
+
+# Opt-in: start loading Sumy/NLTK at import time so the first article is not slow.
+# Off by default so tests and short-lived scripts don't pay for it.
+if os.environ.get('NEWSBOT_PREWARM') == '1':
+    threading.Thread(target=_prewarm, name='summarizer-prewarm', daemon=True).start()
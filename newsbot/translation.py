@@ -0,0 +1,181 @@
+"""
+Shared helpers for translating article text with googletrans.
+Used by main.py and the integration test scripts.
+"""
+
+import hashlib
+import os
+import random
+import re
+import threading
+import time
+from typing import List, Optional
+
+# googletrans imports cgi.parse_header, so the compatibility shim goes first
+import _cgi_shim  # noqa: F401
+from _sqlite_cache import SQLiteCache
+
+# Timeout in seconds for each googletrans request
+TRANSLATE_TIMEOUT = 5.0
+_translator = None
+_translator_lock = threading.Lock()
+
+# Anything ' '.join(text.split()) would change: leading or trailing whitespace, a run
+# of two whitespace characters, or whitespace other than a plain space. re's \s and
+# str.split() use the same definition of whitespace.
+_UNNORMALIZED_WS_RE = re.compile(r'^\s|\s$|\s\s|[^\S ]')
+
+# Google Translate requests start failing or coming back cut short around 5000
+# characters, so longer texts are sent in pieces of at most this many characters
+TRANSLATE_CHUNK_CHARS = 4500
+
+TRANSLATE_ATTEMPTS = 3
+
+# Where to cut long texts, best first: after a paragraph break, then after a sentence
+# end (Latin and Bangla punctuation). Failing both, the cut goes after the last space.
+_PREFERRED_BREAKS = (('\n\n',), ('. ', '! ', '? ', '। '))
+_WORD_BREAKS = (' ', '\n')
+
+
+# On-disk cache of googletrans results, so re-running over the same articles does not
+# send the same text to Google Translate again. It is off unless NEWSBOT_TRANSLATION_CACHE
+# names a database file, so tests that patch the translator always reach the patched object.
+TRANSLATION_CACHE_FILE = os.environ.get('NEWSBOT_TRANSLATION_CACHE', '')
+_cache = SQLiteCache(TRANSLATION_CACHE_FILE, 'CREATE TABLE IF NOT EXISTS translations (key BLOB PRIMARY KEY, value TEXT)')
+
+
+def get_translator():
+    """
+    Return the process-wide googletrans Translator, creating it on first use.
+    Sharing one instance reuses its keep-alive HTTP connection for every request;
+    googletrans and httpx are only imported here, so callers that never translate skip them.
+    
+    Returns:
+        The shared Translator
+    """
+    global _translator
+    with _translator_lock:
+        if _translator is None:
+            import httpx
+            from googletrans import Translator
+            _translator = Translator(timeout=httpx.Timeout(TRANSLATE_TIMEOUT))
+    return _translator
+
+
+def normalize_whitespace(text: str) -> str:
+    """
+    Collapse whitespace runs to single spaces and trim the ends, like ' '.join(text.split()).
+    Text that is already normalized (most titles) is returned as is, without building
+    the word list.
+    
+    Args:
+        text: Input text
+    
+    Returns:
+        The normalized text
+    """
+    if _UNNORMALIZED_WS_RE.search(text) is None:
+        return text
+    return ' '.join(text.split())
+
+
+def _last_break(text: str, start: int, end: int, separators) -> int:
+    """Return the position just after the last separator inside text[start:end], or -1."""
+    cut = -1
+    for sep in separators:
+        i = text.rfind(sep, start, end)
+        if i >= 0:
+            cut = max(cut, i + len(sep))
+    return cut
+
+
+def split_for_translation(text: str, limit: int = TRANSLATE_CHUNK_CHARS) -> List[str]:
+    """
+    Split text into pieces short enough for one translate request.
+    Each cut is made after the last paragraph break that fits, else after the last
+    sentence end, as long as that keeps at least half a piece; otherwise after the
+    last space. Separators stay at the end of their piece, so ''.join(pieces) == text.
+    
+    Args:
+        text: Text to split
+        limit: Maximum piece length in characters
+    
+    Returns:
+        The pieces in order (a single piece if text is short enough)
+    """
+    chunks = []
+    start = 0
+    while len(text) - start > limit:
+        end = start + limit
+        for separators in _PREFERRED_BREAKS:
+            cut = _last_break(text, start, end, separators)
+            if cut >= start + limit // 2:
+                break
+        else:
+            cut = _last_break(text, start, end, _WORD_BREAKS)
+            if cut < 0:
+                cut = end
+        chunks.append(text[start:cut])
+        start = cut
+    if start < len(text):
+        chunks.append(text[start:])
+    return chunks
+
+
+def translate_with_retry(translator, text: str, dest: str) -> str:
+    """
+    Translate text with googletrans, retrying transient network failures.
+    Retries back off exponentially (0.2 s, 0.4 s, ...) with a little jitter.
+    
+    Args:
+        translator: googletrans Translator
+        text: Text to translate
+        dest: Destination language code
+    
+    Returns:
+        The translated text
+    
+    Raises:
+        The last error once all attempts have failed, or any non-transient error at once
+    """
+    import httpx
+    # Failures worth retrying: dropped connections and timeouts (httpx is the HTTP
+    # client googletrans is built on). Anything else fails on the first attempt.
+    transient_errors = (
+        ConnectionError, TimeoutError,
+        httpx.NetworkError, httpx.ConnectTimeout, httpx.ReadTimeout, httpx.WriteTimeout, httpx.PoolTimeout
+    )
+    for attempt in range(TRANSLATE_ATTEMPTS):
+        try:
+            return translator.translate(text, dest=dest).text
+        except transient_errors:
+            if attempt == TRANSLATE_ATTEMPTS - 1:
+                raise
+            time.sleep(0.2 * 2 ** attempt + random.random() * 0.1)
+
+
+def _cache_key(text: str, dest: str) -> bytes:
+    """Hash the destination language and the (normalized) source text."""
+    return hashlib.blake2b(f"{dest}\0{text}".encode('utf-8'), digest_size=16).digest()
+
+
+def get_cached_translation(text: str, dest: str) -> Optional[str]:
+    """
+    Look up an earlier translation of text.
+    
+    Args:
+        text: Source text, normalized the same way as when it was stored
+        dest: Destination language code
+    
+    Returns:
+        The cached translation, or None on a miss (or when caching is disabled)
+    """
+    row = _cache.fetchone('SELECT value FROM translations WHERE key = ?', (_cache_key(text, dest),))
+    return row[0] if row else None
+
+
+def cache_translation(text: str, dest: str, translated: str):
+    """Store a successful translation; failures are ignored since the cache is only an optimization."""
+    _cache.execute(
+        'INSERT OR REPLACE INTO translations (key, value) VALUES (?, ?)', (_cache_key(text, dest), translated)
+    )
@@ -18,6 +18,10 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+def _is_blank(text):
+    """True for empty or whitespace-only text (same as `not text.strip()`, without the copy)."""
+    return not text or text.isspace()
+
 def test_article_validation():
     """Test that articles without text are properly validated."""
     
@@ -27,7 +31,7 @@ def test_article_validation():
     logger.info("=" * 60)
     
     summary_bn = ""
-    if not summary_bn or not summary_bn.strip():
+    if _is_blank(summary_bn):
         logger.error(f"ERROR: summary_bn is empty! Cannot post article without text.")
         logger.error(f"  This usually means:")
         logger.error(f"  1. OPENAI_API_KEY is not set or invalid")
@@ -43,7 +47,7 @@ def test_article_validation():
     logger.info("=" * 60)
     
     summary_bn = "   \n\t  "
-    if not summary_bn or not summary_bn.strip():
+    if _is_blank(summary_bn):
         logger.error(f"ERROR: summary_bn is empty! Cannot post article without text.")
         logger.info("✓ Validation correctly detected whitespace-only article - would skip posting")
     else:
@@ -55,7 +59,7 @@ def test_article_validation():
     logger.info("=" * 60)
     
     summary_bn = "এটি একটি সম্পূর্ণ বাংলা সংবাদ নিবন্ধ। এটি পেশাদার সাংবাদিকের মতো লেখা হয়েছে।"
-    if not summary_bn or not summary_bn.strip():
+    if _is_blank(summary_bn):
         logger.error("✗ Validation failed - should have passed valid article")
     else:
         logger.info(f"✓ Validation passed - article has {len(summary_bn)} characters")
@@ -14,7 +14,11 @@ Features:
 import sys
 import os
 import argparse
+import io
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 
 # Fix Windows console encoding for emojis
 if sys.platform == 'win32':
@@ -23,73 +27,48 @@ if sys.platform == 'win32':
     except:
         pass
 
-# Compatibility fix for Python 3.13+ where cgi module was removed
-# googletrans may try to import cgi.parse_header, so we provide a shim
-def _create_parse_header():
-    """Create parse_header function for cgi compatibility."""
-    def parse_header(line):
-        """Parse a Content-Type like header."""
-        if ';' in line:
-            main, params = line.split(';', 1)
-            main = main.strip()
-            param_dict = {}
-            for param in params.split(';'):
-                if '=' in param:
-                    key, value = param.split('=', 1)
-                    param_dict[key.strip()] = value.strip().strip('"\'')
-            return main, param_dict
-        return line.strip(), {}
-    return parse_header
-
-try:
-    import cgi
-    # cgi exists but may be deprecated - that's fine
-    # Ensure parse_header exists (some Python versions may not have it accessible)
-    if not hasattr(cgi, 'parse_header'):
-        cgi.parse_header = _create_parse_header()
-    # Also ensure it's callable (in case of access issues)
-    if not callable(getattr(cgi, 'parse_header', None)):
-        cgi.parse_header = _create_parse_header()
-except ImportError:
-    # Create a minimal cgi module shim for compatibility (Python 3.13+)
-    import sys
-    from urllib.parse import parse_qs, unquote
-    
-    class cgi:
-        @staticmethod
-        def parse_qs(qs, keep_blank_values=False, strict_parsing=False):
-            return parse_qs(qs, keep_blank_values=keep_blank_values, strict_parsing=strict_parsing)
-        
-        @staticmethod
-        def unquote(s):
-            return unquote(s)
-        
-        @staticmethod
-        def parse_header(line):
-            """Parse a Content-Type like header."""
-            if ';' in line:
-                main, params = line.split(';', 1)
-                main = main.strip()
-                param_dict = {}
-                for param in params.split(';'):
-                    if '=' in param:
-                        key, value = param.split('=', 1)
-                        param_dict[key.strip()] = value.strip().strip('"\'')
-                return main, param_dict
-            return line.strip(), {}
-    
-    sys.modules['cgi'] = cgi
-    # Also set parse_header as a module-level function for compatibility
-    cgi.parse_header = _create_parse_header()
-
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'newsbot'))
 
+# Compatibility fix for Python 3.13+ where cgi module was removed
+# googletrans may try to import cgi.parse_header, so install the shim first
+import _cgi_shim  # noqa: F401
+
 # scrape_news will be imported after API key check
-from googletrans import Translator
+from translation import (
+    cache_translation, get_cached_translation, get_translator, normalize_whitespace, split_for_translation,
+    translate_with_retry
+)
 import json
 
-# Initialize translator
-translator = Translator()
+# Report rules
+_EQ80 = "=" * 80
+_DASH80 = "-" * 80
+_DASH76 = "-" * 76
+
+# The translator (shared with the other modules that translate) is created on first
+# use, so --help and early exits (e.g. a missing API key) never set up googletrans
+def __getattr__(name):
+    if name == 'translator':
+        return get_translator()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+# Maximum number of googletrans requests in flight for translate_many(); kept low
+# because Google throttles clients that send many requests at once
+_MAX_CONCURRENT_TRANSLATIONS = 5
+
+@lru_cache(maxsize=1024)
+def _translate_normalized(text, dest):
+    """Translate whitespace-normalized text (memoized, so a repeated text costs one request per run)."""
+    cached = get_cached_translation(text, dest)
+    if cached is not None:
+        return cached
+    
+    # Long texts are translated in sentence-aligned pieces instead of being cut off
+    translated = ' '.join(
+        translate_with_retry(get_translator(), chunk, dest) for chunk in split_for_translation(text)
+    )
+    cache_translation(text, dest, translated)
+    return translated
 
 def translate_text(text, dest='bn'):
     """Translate text to Bangla using googletrans."""
@@ -97,48 +76,101 @@ def translate_text(text, dest='bn'):
         return ""
     
     try:
-        text = ' '.join(text.split())
-        if len(text) > 8000:
-            text = text[:8000]
-        
-        result = translator.translate(text, dest=dest)
-        return result.text
+        text = normalize_whitespace(text)
+        return _translate_normalized(text, dest)
     except Exception as e:
         print(f"⚠️  Translation failed: {e}")
         return text
 
+def translate_many(texts, dest='bn'):
+    """
+    Translate several texts, sending each distinct text to googletrans only once.
+    
+    The pinned googletrans (4.0.0-rc1) takes a single string per request, so the
+    distinct texts are sent as separate requests, up to _MAX_CONCURRENT_TRANSLATIONS
+    at once over the translator's shared connection pool.
+    
+    Args:
+        texts: Texts to translate
+        dest: Destination language (default: 'bn' for Bangla)
+    
+    Returns:
+        The translations, in the same order as texts (see translate_text)
+    """
+    unique = list(dict.fromkeys(texts))
+    if len(unique) < 2:
+        results = [translate_text(text, dest=dest) for text in unique]
+    else:
+        workers = min(_MAX_CONCURRENT_TRANSLATIONS, len(unique))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(lambda text: translate_text(text, dest=dest), unique))
+    translated = dict(zip(unique, results))
+    return [translated[text] for text in texts]
+
 def count_bangla_chars(text):
     """Count Bangla characters in text."""
     if not text:
         return 0
-    # Count Bengali Unicode range: U+0980 to U+09FF
-    bangla_count = sum(1 for char in text if '\u0980' <= char <= '\u09FF')
-    return bangla_count
+    # Count Bengali Unicode range: U+0980 to U+09FF. In UTF-8 every such character
+    # starts with the bytes E0 A6 or E0 A7 (and no other character does), so counting
+    # those prefixes in the encoded text counts the characters without a Python loop
+    data = text.encode('utf-8', 'surrogatepass')
+    return data.count(b'\xe0\xa6') + data.count(b'\xe0\xa7')
+
+def _looks_bengali(text, sample=64):
+    """True if more than half of the first sample characters are Bangla."""
+    head = text[:sample]
+    return count_bangla_chars(head) * 2 > len(head)
+
+def bn_stats(text):
+    """Return (length in characters, Bangla characters) of text; len() is O(1), so only one scan."""
+    return len(text), count_bangla_chars(text)
+
+@dataclass(slots=True)
+class Metrics:
+    """Text quality metrics of one article (see analyze_text_quality)."""
+    title_length: int
+    title_bangla_chars: int
+    summary_length: int
+    summary_bangla_chars: int
+    summary_sentences: int
+    summary_words: int
 
 def analyze_text_quality(title_bn, summary_bn):
     """Analyze text quality metrics."""
-    metrics = {
-        'title_length': len(title_bn) if title_bn else 0,
-        'title_bangla_chars': count_bangla_chars(title_bn) if title_bn else 0,
-        'summary_length': len(summary_bn) if summary_bn else 0,
-        'summary_bangla_chars': count_bangla_chars(summary_bn) if summary_bn else 0,
-        'summary_sentences': summary_bn.count('।') + summary_bn.count('.') if summary_bn else 0,
-        'summary_words': len(summary_bn.split()) if summary_bn else 0,
-    }
-    return metrics
+    title_bn = title_bn or ''
+    summary_bn = summary_bn or ''
+    title_length, title_bangla_chars = bn_stats(title_bn)
+    summary_length, summary_bangla_chars = bn_stats(summary_bn)
+    return Metrics(
+        title_length=title_length,
+        title_bangla_chars=title_bangla_chars,
+        summary_length=summary_length,
+        summary_bangla_chars=summary_bangla_chars,
+        # Two str.count() scans run in C and beat a single regex or Python-level pass
+        summary_sentences=summary_bn.count('।') + summary_bn.count('.'),
+        summary_words=len(summary_bn.split()),
+    )
 
 def format_output(articles, output_lang, save_to_file=False, show_stats=True, show_full=True):
-    """Format and display output."""
-    output_lines = []
+    """
+    Format and display output.
+    
+    Lines are collected in a buffer and printed with a single write at the end
+    (unless save_to_file is set), instead of one print() call per line.
+    
+    Returns:
+        The report text, one line per add_line call
+    """
+    buf = io.StringIO()
     
     def add_line(text=""):
-        output_lines.append(text)
-        if not save_to_file:
-            print(text)
+        buf.write(text)
+        buf.write('\n')
     
-    add_line("=" * 80)
+    add_line(_EQ80)
     add_line("🧪 Testing Bangla Text Generation")
-    add_line("=" * 80)
+    add_line(_EQ80)
     add_line(f"📅 Test Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     add_line()
     
@@ -148,25 +180,36 @@ def format_output(articles, output_lang, save_to_file=False, show_stats=True, sh
     
     if show_stats:
         add_line("📊 STATISTICS")
-        add_line("-" * 80)
+        add_line(_DASH80)
         add_line(f"   Total articles scraped: {total_articles}")
         add_line(f"   Articles with summaries: {articles_with_summary}")
         add_line(f"   Summarizer: OpenAI (output_language: {output_lang})")
         add_line()
     
     # Process each article
-    add_line("=" * 80)
+    add_line(_EQ80)
     add_line("📄 BANGLA TEXT PREVIEW")
-    add_line("=" * 80)
+    add_line(_EQ80)
     add_line()
     
     all_metrics = []
     
+    # Collect every title (and Swedish summary) and translate them in one go. When
+    # OpenAI writes Bangla, titles that are already Bangla are used as they are
+    sources = []
+    for article in articles:
+        if article.get('title_sv'):
+            if not (output_lang == 'bn' and _looks_bengali(article['title_sv'])):
+                sources.append(article['title_sv'])
+            if output_lang != 'bn' and article.get('summary_sv'):
+                sources.append(article['summary_sv'])
+    translations = dict(zip(sources, translate_many(sources, dest='bn')))
+    
     for i, article in enumerate(articles, 1):
         add_line()
-        add_line("=" * 80)
+        add_line(_EQ80)
         add_line(f"ARTICLE {i} of {total_articles}")
-        add_line("=" * 80)
+        add_line(_EQ80)
         
         # Get article data
         title_sv = article.get('title_sv', '')
@@ -190,17 +233,18 @@ def format_output(articles, output_lang, save_to_file=False, show_stats=True, sh
         # Show scraped content that was sent to OpenAI
         if content_sv:
             add_line(f"\n📄 Scraped Content (Sent to OpenAI for Summarization):")
-            add_line(f"   {'-'*76}")
+            add_line(f"   {_DASH76}")
             # Show first 1000 characters of the scraped content
-            content_preview = content_sv[:1000] if len(content_sv) > 1000 else content_sv
-            # Split into lines for better readability
-            content_lines = content_preview.split('\n')
+            content_preview = content_sv[:1000]
+            # Split into lines for better readability; maxsplit stops after the first
+            # 10 lines instead of splitting the whole preview
+            content_lines = content_preview.split('\n', 10)
             for line in content_lines[:10]:  # Show first 10 lines
                 if line.strip():
                     add_line(f"   {line.strip()}")
             if len(content_sv) > 1000:
                 add_line(f"   ... (truncated, total length: {len(content_sv)} characters)")
-            add_line(f"   {'-'*76}")
+            add_line(f"   {_DASH76}")
             add_line(f"   Total scraped content length: {len(content_sv)} characters")
             add_line(f"   Total words: {len(content_sv.split())} words")
             add_line()
@@ -210,7 +254,7 @@ def format_output(articles, output_lang, save_to_file=False, show_stats=True, sh
         
         # Translate title to Bangla
         add_line(f"\n🌐 Translated Bangla Title:")
-        title_bn = translate_text(title_sv, dest='bn')
+        title_bn = translations.get(title_sv, title_sv)
         add_line(f"   {title_bn}")
         add_line(f"   (Length: {len(title_bn)} characters, Bangla chars: {count_bangla_chars(title_bn)})")
         
@@ -223,7 +267,7 @@ def format_output(articles, output_lang, save_to_file=False, show_stats=True, sh
                 add_line(f"\n   Original Swedish Summary:")
                 add_line(f"   {summary_sv}")
                 add_line(f"\n   Translated to Bangla:")
-                summary_bn = translate_text(summary_sv, dest='bn')
+                summary_bn = translations[summary_sv]
                 add_line(f"   {summary_bn}")
             else:
                 summary_bn = summary_sv  # Already in Bangla
@@ -236,17 +280,17 @@ def format_output(articles, output_lang, save_to_file=False, show_stats=True, sh
             
             if show_stats:
                 add_line(f"\n   📊 Text Quality Metrics:")
-                add_line(f"      Summary length: {metrics['summary_length']} characters")
-                add_line(f"      Bangla characters: {metrics['summary_bangla_chars']} ({metrics['summary_bangla_chars']/max(metrics['summary_length'],1)*100:.1f}%)")
-                add_line(f"      Words: {metrics['summary_words']}")
-                add_line(f"      Sentences: {metrics['summary_sentences']}")
+                add_line(f"      Summary length: {metrics.summary_length} characters")
+                add_line(f"      Bangla characters: {metrics.summary_bangla_chars} ({metrics.summary_bangla_chars/max(metrics.summary_length,1)*100:.1f}%)")
+                add_line(f"      Words: {metrics.summary_words}")
+                add_line(f"      Sentences: {metrics.summary_sentences}")
         else:
             add_line(f"\n⚠️  No summary generated")
             summary_bn = ""
         
         # Show what would be posted
         add_line(f"\n📱 What would be posted to Facebook:")
-        add_line(f"   {'-'*76}")
+        add_line(f"   {_DASH76}")
         if summary_bn:
             if show_full:
                 add_line(f"   {summary_bn}")
@@ -256,18 +300,26 @@ def format_output(articles, output_lang, save_to_file=False, show_stats=True, sh
                 add_line(f"   {truncated}")
             add_line()
         add_line(f"   🔗 সূত্র: {url}")
-        add_line(f"   {'-'*76}")
+        add_line(f"   {_DASH76}")
     
     # Overall statistics
     if show_stats and all_metrics:
         add_line()
-        add_line("=" * 80)
+        add_line(_EQ80)
         add_line("📊 OVERALL STATISTICS")
-        add_line("=" * 80)
-        avg_summary_len = sum(m['summary_length'] for m in all_metrics) / len(all_metrics)
-        avg_bangla_pct = sum(m['summary_bangla_chars']/max(m['summary_length'],1)*100 for m in all_metrics) / len(all_metrics)
-        avg_words = sum(m['summary_words'] for m in all_metrics) / len(all_metrics)
-        avg_sentences = sum(m['summary_sentences'] for m in all_metrics) / len(all_metrics)
+        add_line(_EQ80)
+        # One pass over the metrics for all four totals
+        total_len = total_bangla_pct = total_words = total_sentences = 0
+        for m in all_metrics:
+            total_len += m.summary_length
+            total_bangla_pct += m.summary_bangla_chars/max(m.summary_length,1)*100
+            total_words += m.summary_words
+            total_sentences += m.summary_sentences
+        n = len(all_metrics)
+        avg_summary_len = total_len / n
+        avg_bangla_pct = total_bangla_pct / n
+        avg_words = total_words / n
+        avg_sentences = total_sentences / n
         
         add_line(f"   Average summary length: {avg_summary_len:.0f} characters")
         add_line(f"   Average Bangla character percentage: {avg_bangla_pct:.1f}%")
@@ -275,9 +327,9 @@ def format_output(articles, output_lang, save_to_file=False, show_stats=True, sh
         add_line(f"   Average sentences per summary: {avg_sentences:.1f}")
         add_line()
     
-    add_line("=" * 80)
+    add_line(_EQ80)
     add_line("✅ Preview complete!")
-    add_line("=" * 80)
+    add_line(_EQ80)
     add_line()
     add_line("💡 Tips:")
     add_line("   - Check the Bangla text quality and readability")
@@ -286,7 +338,36 @@ def format_output(articles, output_lang, save_to_file=False, show_stats=True, sh
     add_line("   - If quality is good, the bot is ready to post!")
     add_line()
     
-    return output_lines
+    output = buf.getvalue()
+    if not save_to_file:
+        sys.stdout.write(output)
+    return output
+
+def _print_api_key_error(*explanation):
+    """Print the missing OPENAI_API_KEY error with setup instructions, after the given explanation lines."""
+    print(_EQ80)
+    print("❌ ERROR: OpenAI API key not found!")
+    print(_EQ80)
+    print()
+    for line in explanation:
+        print(line)
+    print()
+    print("To fix this:")
+    print("1. Get your OpenAI API key from: https://platform.openai.com/api-keys")
+    print("2. Set the environment variable:")
+    print()
+    print("   Windows PowerShell:")
+    print("   $env:OPENAI_API_KEY='sk-your-key-here'")
+    print()
+    print("   Windows CMD:")
+    print("   set OPENAI_API_KEY=sk-your-key-here")
+    print()
+    print("   Linux/Mac:")
+    print("   export OPENAI_API_KEY='sk-your-key-here'")
+    print()
+    print("3. Run the test script again")
+    print()
+    print(_EQ80)
 
 def main():
     parser = argparse.ArgumentParser(description='Test Bangla text generation without posting to Facebook')
@@ -324,29 +405,10 @@ def main():
     if summarizer_type == "openai":
         api_key = os.environ.get('OPENAI_API_KEY')
         if not api_key:
-            print("=" * 80)
-            print("❌ ERROR: OpenAI API key not found!")
-            print("=" * 80)
-            print()
-            print("The bot is configured to use OpenAI summarizer, but OPENAI_API_KEY")
-            print("environment variable is not set.")
-            print()
-            print("To fix this:")
-            print("1. Get your OpenAI API key from: https://platform.openai.com/api-keys")
-            print("2. Set the environment variable:")
-            print()
-            print("   Windows PowerShell:")
-            print("   $env:OPENAI_API_KEY='sk-your-key-here'")
-            print()
-            print("   Windows CMD:")
-            print("   set OPENAI_API_KEY=sk-your-key-here")
-            print()
-            print("   Linux/Mac:")
-            print("   export OPENAI_API_KEY='sk-your-key-here'")
-            print()
-            print("3. Run the test script again")
-            print()
-            print("=" * 80)
+            _print_api_key_error(
+                "The bot is configured to use OpenAI summarizer, but OPENAI_API_KEY",
+                "environment variable is not set."
+            )
             return
     
     # Import scrape_news after API key check
@@ -354,35 +416,14 @@ def main():
         from scrape_news import scrape_news
     except ValueError as e:
         if "OpenAI API key required" in str(e):
-            print("=" * 80)
-            print("ERROR: OpenAI API key not found!")
-            print("=" * 80)
-            print()
-            print("The summarizer requires an OpenAI API key.")
-            print()
-            print("To fix this:")
-            print("1. Get your OpenAI API key from: https://platform.openai.com/api-keys")
-            print("2. Set the environment variable:")
-            print()
-            print("   Windows PowerShell:")
-            print("   $env:OPENAI_API_KEY='sk-your-key-here'")
-            print()
-            print("   Windows CMD:")
-            print("   set OPENAI_API_KEY=sk-your-key-here")
-            print()
-            print("   Linux/Mac:")
-            print("   export OPENAI_API_KEY='sk-your-key-here'")
-            print()
-            print("3. Run the test script again")
-            print()
-            print("=" * 80)
+            _print_api_key_error("The summarizer requires an OpenAI API key.")
             return
         else:
             raise
     
     # Scrape articles
     print("Scraping articles...")
-    print("-" * 80)
+    print(_DASH80)
     try:
         data = scrape_news()
         articles = data.get('articles', [])
@@ -390,28 +431,7 @@ def main():
         print()
     except ValueError as e:
         if "OpenAI API key required" in str(e):
-            print("=" * 80)
-            print("❌ ERROR: OpenAI API key not found!")
-            print("=" * 80)
-            print()
-            print("The summarizer requires an OpenAI API key.")
-            print()
-            print("To fix this:")
-            print("1. Get your OpenAI API key from: https://platform.openai.com/api-keys")
-            print("2. Set the environment variable:")
-            print()
-            print("   Windows PowerShell:")
-            print("   $env:OPENAI_API_KEY='sk-your-key-here'")
-            print()
-            print("   Windows CMD:")
-            print("   set OPENAI_API_KEY=sk-your-key-here")
-            print()
-            print("   Linux/Mac:")
-            print("   export OPENAI_API_KEY='sk-your-key-here'")
-            print()
-            print("3. Run the test script again")
-            print()
-            print("=" * 80)
+            _print_api_key_error("The summarizer requires an OpenAI API key.")
         else:
             print(f"❌ Error scraping: {e}")
         return
@@ -429,7 +449,7 @@ def main():
     articles = articles[:args.limit]
     
     # Format and display output
-    output_lines = format_output(
+    output = format_output(
         articles, 
         output_lang, 
         save_to_file=args.save,
@@ -442,7 +462,7 @@ def main():
         output_file = args.output
         try:
             with open(output_file, 'w', encoding='utf-8') as f:
-                f.write('\n'.join(output_lines))
+                f.write(output)
             print(f"\n💾 Output saved to: {output_file}")
         except Exception as e:
             print(f"\n❌ Error saving file: {e}")
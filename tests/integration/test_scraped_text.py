@@ -7,8 +7,20 @@ Shows what content the bot is actually scraping and processing.
 import sys
 import os
 import argparse
+import io
+import traceback
 from datetime import datetime
+from functools import lru_cache
+from itertools import islice
+from pathlib import Path
 import json
+import numpy as np
+
+try:
+    # Optional: much faster pretty-printing of the raw article JSON
+    import orjson
+except ImportError:
+    orjson = None
 
 # Fix Windows console encoding for emojis
 if sys.platform == 'win32':
@@ -17,82 +29,138 @@ if sys.platform == 'win32':
     except:
         pass
 
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'newsbot'))
+
 # Compatibility fix for cgi module
-try:
-    import cgi
-    if not hasattr(cgi, 'parse_header'):
-        def _create_parse_header():
-            def parse_header(line):
-                if ';' in line:
-                    main, params = line.split(';', 1)
-                    main = main.strip()
-                    param_dict = {}
-                    for param in params.split(';'):
-                        if '=' in param:
-                            key, value = param.split('=', 1)
-                            param_dict[key.strip()] = value.strip().strip('"\'')
-                    return main, param_dict
-                return line.strip(), {}
-            return parse_header
-        cgi.parse_header = _create_parse_header()
-except ImportError:
-    import sys
-    from urllib.parse import parse_qs, unquote
-    def _create_parse_header():
-        def parse_header(line):
-            if ';' in line:
-                main, params = line.split(';', 1)
-                main = main.strip()
-                param_dict = {}
-                for param in params.split(';'):
-                    if '=' in param:
-                        key, value = param.split('=', 1)
-                        param_dict[key.strip()] = value.strip().strip('"\'')
-                return main, param_dict
-            return line.strip(), {}
-        return parse_header
+import _cgi_shim  # noqa: F401
+
+# Banner rules used throughout the report
+_EQ80 = "=" * 80
+_DASH80 = "─" * 80
+
+CONFIG_FILE = os.path.join(os.path.dirname(__file__), '..', '..', 'newsbot', 'config.json')
+
+@lru_cache(maxsize=1)
+def load_config():
+    """Load newsbot/config.json once per process ({} if it is missing or unreadable)."""
+    path = Path(CONFIG_FILE)
+    if not path.exists():
+        return {}
+    try:
+        data = path.read_bytes()
+        return orjson.loads(data) if orjson is not None else json.loads(data)
+    except (OSError, ValueError):
+        # ValueError covers invalid JSON (json and orjson) and bad UTF-8
+        return {}
+
+def dumps_pretty(obj):
+    """Serialize to indented JSON, same output as json.dumps(indent=2, ensure_ascii=False)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode('utf-8')
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+def _format_article(i, article, n, full_content):
+    """
+    Format one article's report block.
     
-    class cgi:
-        @staticmethod
-        def parse_qs(qs, keep_blank_values=False, strict_parsing=False):
-            return parse_qs(qs, keep_blank_values=keep_blank_values, strict_parsing=strict_parsing)
-        
-        @staticmethod
-        def unquote(s):
-            return unquote(s)
-        
-        @staticmethod
-        def parse_header(line):
-            return _create_parse_header()(line)
+    Args:
+        i: 1-based position of the article
+        article: Scraped article dictionary
+        n: Total number of articles in the report
+        full_content: Show the whole content instead of the first 2000 characters
     
-    sys.modules['cgi'] = cgi
-
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'newsbot'))
+    Returns:
+        The block's text, one line per add_line call
+    """
+    buf = io.StringIO()
+    
+    def add_line(text=""):
+        buf.write(text)
+        buf.write('\n')
+    
+    add_line()
+    add_line(_EQ80)
+    add_line(f"ARTICLE {i} of {n}")
+    add_line(_EQ80)
+    add_line()
+    
+    # Basic info
+    url = article.get('url', 'No URL')
+    title_sv = article.get('title_sv', 'No title')
+    category = article.get('category', 'Unknown')
+    scraped_at = article.get('scraped_at', 'Unknown')
+    
+    add_line(f"Category: {category}")
+    add_line(f"URL: {url}")
+    add_line(f"Scraped at: {scraped_at}")
+    add_line()
+    
+    # Title
+    add_line(_DASH80)
+    add_line("TITLE (Swedish):")
+    add_line(_DASH80)
+    add_line(title_sv)
+    add_line(f"(Length: {len(title_sv)} characters)")
+    add_line()
+    
+    # Full scraped content (this is what was actually scraped from the page)
+    content_sv = article.get('content_sv', '')
+    content_len = len(content_sv)
+    if content_sv:
+        add_line(_DASH80)
+        add_line("SCRAPED CONTENT (Swedish):")
+        add_line(_DASH80)
+        if full_content:
+            # Show full content
+            add_line(content_sv)
+        else:
+            # Show first 2000 characters by default (slicing a shorter string
+            # returns it as-is, so short articles are never copied)
+            add_line(content_sv[:2000])
+            if content_len > 2000:
+                add_line(f"\n... (truncated, total length: {content_len} characters)")
+                add_line(f"Use --full-content to see the complete text")
+        add_line(f"(Length: {content_len} characters)")
+        add_line(f"(Words: {len(content_sv.split())} words)")
+        add_line()
+    else:
+        add_line(_DASH80)
+        add_line("SCRAPED CONTENT (Swedish):")
+        add_line(_DASH80)
+        add_line("No content found (content_sv not in article data)")
+        add_line()
+    
+    # Raw JSON (for debugging) - exclude summary
+    add_line(_DASH80)
+    add_line("RAW DATA (JSON):")
+    add_line(_DASH80)
+    # Include content_sv in JSON if it exists (truncate if too long), exclude summary
+    article_copy = {k: v for k, v in article.items() if k != 'summary_sv'}
+    if content_sv and not full_content and content_len > 500:
+        article_copy['content_sv'] = content_sv[:500] + "... (truncated)"
+    add_line(dumps_pretty(article_copy))
+    add_line()
+    return buf.getvalue()
 
 def main():
-    parser = argparse.ArgumentParser(description='View scraped article text (output is always saved to file)')
+    parser = argparse.ArgumentParser(description='View scraped article text (output is saved to file unless --no-file is given)')
     parser.add_argument('--output', '-o', type=str, default='tests/output/scraped_text_output.txt', help='Output file name (default: tests/output/scraped_text_output.txt)')
     parser.add_argument('--limit', '-l', type=int, default=5, help='Limit number of articles (default: 5)')
     parser.add_argument('--full-content', action='store_true', help='Show full article content (if not set, shows first 2000 chars)')
+    parser.add_argument('--workers', '-w', type=int, default=4, help='Number of pages fetched concurrently (default: 4)')
+    parser.add_argument('--no-cache', action='store_true', help='Download and parse every article instead of reusing unchanged cached ones')
+    parser.add_argument('--no-file', action='store_true', help='Only print to the terminal, do not save the output file')
     
     args = parser.parse_args()
     
-    print("=" * 80)
+    print(_EQ80)
     print("Scraped Article Text Viewer")
-    print("=" * 80)
+    print(_EQ80)
     print(f"Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print()
     
     # Check for OpenAI API key if needed
-    config_file = os.path.join(os.path.dirname(__file__), '..', '..', 'newsbot', 'config.json')
-    summarizer_type = "sumy"
-    try:
-        with open(config_file, 'r', encoding='utf-8') as f:
-            config = json.load(f)
-            summarizer_config = config.get("summarizer", {})
-            summarizer_type = summarizer_config.get("type", "sumy")
-    except:
-        pass
+    summarizer_type = load_config().get("summarizer", {}).get("type", "sumy")
     
     if summarizer_type == "openai":
         api_key = os.environ.get('OPENAI_API_KEY')
@@ -103,14 +171,14 @@ def main():
             print()
     
     # Import after cgi fix
-    scrape_news = None
+    scrape_news_iter = None
     try:
-        from scrape_news import scrape_news
+        from scrape_news import scrape_news_iter
     except ValueError as e:
         if "OpenAI API key required" in str(e):
-            print("=" * 80)
+            print(_EQ80)
             print("WARNING: OpenAI API key not found")
-            print("=" * 80)
+            print(_EQ80)
             print()
             print("The bot is configured to use OpenAI summarizer.")
             print("Without the API key, summaries won't be generated.")
@@ -124,16 +192,14 @@ def main():
             return
         else:
             print(f"Error importing scrape_news: {e}")
-            import traceback
             traceback.print_exc()
             return
     except Exception as e:
         print(f"Error importing scrape_news: {e}")
-        import traceback
         traceback.print_exc()
         return
     
-    if scrape_news is None:
+    if scrape_news_iter is None:
         print("Error: Could not import scrape_news")
         return
     
@@ -141,13 +207,15 @@ def main():
     print("Scraping articles...")
     print("-" * 80)
     try:
-        data = scrape_news()
-        articles = data.get('articles', [])
+        # Only the first --limit articles are scraped; the rest are never fetched
+        articles = list(islice(
+            scrape_news_iter(max_workers=args.workers, use_cache=not args.no_cache),
+            args.limit
+        ))
         print(f"Scraped {len(articles)} articles")
         print()
     except Exception as e:
         print(f"Error scraping: {e}")
-        import traceback
         traceback.print_exc()
         return
     
@@ -155,93 +223,56 @@ def main():
         print("No articles found!")
         return
     
-    # Limit articles
-    articles = articles[:args.limit]
+    # Save to file unless --no-file: lines are written as they are printed, so the
+    # whole report (with --full-content it can be large) is never held in memory.
+    # The file is binary; each article's text is UTF-8 encoded in one call
+    out = None
+    if not args.no_file:
+        try:
+            out = open(args.output, 'wb', buffering=1 << 16)
+        except Exception as e:
+            print(f"\nError saving file: {e}")
     
-    output_lines = []
+    # Lines are collected per article and written to the terminal (and the file)
+    # in one go, instead of one print() call per line
+    buf = io.StringIO()
     
     def add_line(text=""):
-        output_lines.append(text)
-        print(text)
+        buf.write(text)
+        buf.write('\n')
+    
+    def write_text(text):
+        sys.stdout.write(text)
+        if out is not None:
+            out.write(text.encode('utf-8'))
+    
+    def flush_lines():
+        write_text(buf.getvalue())
+        buf.seek(0)
+        buf.truncate(0)
     
-    add_line("=" * 80)
+    add_line(_EQ80)
     add_line("📄 SCRAPED ARTICLE TEXT")
-    add_line("=" * 80)
+    add_line(_EQ80)
     add_line()
+    flush_lines()
     
     for i, article in enumerate(articles, 1):
-        add_line()
-        add_line("=" * 80)
-        add_line(f"ARTICLE {i} of {len(articles)}")
-        add_line("=" * 80)
-        add_line()
-        
-        # Basic info
-        url = article.get('url', 'No URL')
-        title_sv = article.get('title_sv', 'No title')
-        category = article.get('category', 'Unknown')
-        scraped_at = article.get('scraped_at', 'Unknown')
-        
-        add_line(f"Category: {category}")
-        add_line(f"URL: {url}")
-        add_line(f"Scraped at: {scraped_at}")
-        add_line()
-        
-        # Title
-        add_line("─" * 80)
-        add_line("TITLE (Swedish):")
-        add_line("─" * 80)
-        add_line(title_sv)
-        add_line(f"(Length: {len(title_sv)} characters)")
-        add_line()
-        
-        # Full scraped content (this is what was actually scraped from the page)
-        content_sv = article.get('content_sv', '')
-        if content_sv:
-            add_line("─" * 80)
-            add_line("SCRAPED CONTENT (Swedish):")
-            add_line("─" * 80)
-            if args.full_content:
-                # Show full content
-                add_line(content_sv)
-            else:
-                # Show first 2000 characters by default
-                content_preview = content_sv[:2000] if len(content_sv) > 2000 else content_sv
-                add_line(content_preview)
-                if len(content_sv) > 2000:
-                    add_line(f"\n... (truncated, total length: {len(content_sv)} characters)")
-                    add_line(f"Use --full-content to see the complete text")
-            add_line(f"(Length: {len(content_sv)} characters)")
-            add_line(f"(Words: {len(content_sv.split())} words)")
-            add_line()
-        else:
-            add_line("─" * 80)
-            add_line("SCRAPED CONTENT (Swedish):")
-            add_line("─" * 80)
-            add_line("No content found (content_sv not in article data)")
-            add_line()
-        
-        # Raw JSON (for debugging) - exclude summary
-        add_line("─" * 80)
-        add_line("RAW DATA (JSON):")
-        add_line("─" * 80)
-        # Include content_sv in JSON if it exists (truncate if too long), exclude summary
-        article_copy = {k: v for k, v in article.items() if k != 'summary_sv'}
-        if 'content_sv' in article_copy and article_copy['content_sv']:
-            if not args.full_content and len(article_copy['content_sv']) > 500:
-                article_copy['content_sv'] = article_copy['content_sv'][:500] + "... (truncated)"
-        add_line(json.dumps(article_copy, indent=2, ensure_ascii=False))
-        add_line()
+        write_text(_format_article(i, article, len(articles), args.full_content))
     
     # Statistics
     add_line()
-    add_line("=" * 80)
+    add_line(_EQ80)
     add_line("STATISTICS")
-    add_line("=" * 80)
+    add_line(_EQ80)
     
-    articles_with_content = sum(1 for a in articles if a.get('content_sv'))
-    avg_title_len = sum(len(a.get('title_sv', '')) for a in articles) / len(articles) if articles else 0
-    avg_content_len = sum(len(a.get('content_sv', '')) for a in articles) / articles_with_content if articles_with_content else 0
+    # Lengths are collected once into arrays and averaged by numpy
+    title_lens = np.fromiter((len(a.get('title_sv', '')) for a in articles), dtype=np.int64, count=len(articles))
+    content_lens = np.fromiter((len(a.get('content_sv') or '') for a in articles), dtype=np.int64, count=len(articles))
+    content_lens = content_lens[content_lens > 0]
+    articles_with_content = int(content_lens.size)
+    avg_title_len = title_lens.mean() if title_lens.size else 0
+    avg_content_len = content_lens.mean() if content_lens.size else 0
     
     add_line(f"Total articles: {len(articles)}")
     add_line(f"Articles with content: {articles_with_content}")
@@ -249,17 +280,17 @@ def main():
     add_line(f"Average content length: {avg_content_len:.0f} characters")
     add_line()
     
-    add_line("=" * 80)
+    add_line(_EQ80)
     add_line("Display complete!")
-    add_line("=" * 80)
+    add_line(_EQ80)
+    flush_lines()
     
-    # Always save to file
-    try:
-        with open(args.output, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(output_lines))
-        print(f"\nOutput saved to: {args.output}")
-    except Exception as e:
-        print(f"\nError saving file: {e}")
+    if out is not None:
+        try:
+            out.close()
+            print(f"\nOutput saved to: {args.output}")
+        except Exception as e:
+            print(f"\nError saving file: {e}")
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,56 @@
+"""
+Unit tests for the cgi.parse_header replacement in newsbot._cgi_shim
+"""
+import os
+import sys
+
+import pytest
+
+# _cgi_shim is imported by name by the newsbot modules, so newsbot itself goes on the path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'newsbot')))
+
+from _cgi_shim import _parse_header
+
+
+# Headers and what cgi.parse_header (Python 3.11) returns for them
+CGI_PARSE_HEADER_RESULTS = [
+    ('text/html', ('text/html', {})),
+    ('', ('', {})),
+    ('text/html; charset=UTF-8', ('text/html', {'charset': 'UTF-8'})),
+    ('application/json;charset=utf-8', ('application/json', {'charset': 'utf-8'})),
+    ('TEXT/HTML; Charset=UTF-8', ('TEXT/HTML', {'charset': 'UTF-8'})),
+    ('text/html ; charset = utf-8 ', ('text/html', {'charset': 'utf-8'})),
+    ('text/html; charset="utf-8"', ('text/html', {'charset': 'utf-8'})),
+    ('text/html; charset="a\\"b"', ('text/html', {'charset': 'a"b'})),
+    ('text/plain; charset=', ('text/plain', {'charset': ''})),
+    ('multipart/form-data; boundary="----x"', ('multipart/form-data', {'boundary': '----x'})),
+    ('form-data; name="file"; filename="a b.txt"', ('form-data', {'name': 'file', 'filename': 'a b.txt'})),
+    ('attachment; filename="a;b.txt"', ('attachment', {'filename': 'a;b.txt'})),
+    ('a; b', ('a', {})),
+    ('a; b; c=1', ('a', {'c': '1'})),
+    ('attachment; filename="x; b"; b', ('attachment', {'filename': 'x; b'})),
+    ('a;;b=2', ('a', {'b': '2'})),
+    ('; a=1', ('', {'a': '1'})),
+    # Malformed headers: the main value is kept exactly, not lowercased or cut short
+    ("X'=", ("X'=", {})),
+    ('a=b; c=d', ('a=b', {'c': 'd'})),
+    ('"q;q"; a=1', ('"q;q"', {'a': '1'})),
+    ('Text/HTML Extra; charset=utf-8', ('Text/HTML Extra', {'charset': 'utf-8'})),
+]
+
+
+class TestParseHeader:
+    """Test suite for _parse_header"""
+    
+    @pytest.mark.parametrize('line, expected', CGI_PARSE_HEADER_RESULTS)
+    def test_matches_cgi_parse_header(self, line, expected):
+        """Test that the result is the same as cgi.parse_header's"""
+        assert _parse_header(line) == expected
+    
+    @pytest.mark.parametrize('line', [
+        "attachment; filename*=UTF-8''na%C3%AFve.txt",
+        "attachment; filename*0*=UTF-8''na%C3%AF; filename*1=ve.txt",
+    ])
+    def test_rfc2231_values_are_strings(self, line):
+        """Test that RFC 2231 encoded parameters are decoded to plain strings"""
+        assert _parse_header(line) == ('attachment', {'filename': 'naïve.txt'})
@@ -0,0 +1,158 @@
+"""
+Unit tests for helpers in newsbot.summarizer
+"""
+import os
+import re
+import sys
+
+import pytest
+
+# summarizer imports its sibling modules by name, so newsbot itself goes on the path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'newsbot')))
+
+import summarizer
+from summarizer import _FastLexRank, _trim_to_budget
+
+
+class _RegexTokenizer:
+    """Sentence/word tokenizer for sumy that needs no NLTK data downloads."""
+    
+    language = 'swedish'
+    
+    def to_sentences(self, paragraph):
+        return [s for s in re.split(r'(?<=[.!?])\s+', paragraph) if s]
+    
+    def to_words(self, sentence):
+        return re.findall(r'\w+', sentence)
+
+
+# Fixed documents: a news-like article, one with repeated (tied) sentences and
+# one whose sentences share no words, so every score is the same
+DOCUMENTS = [
+    "Regeringen presenterade på måndagen en ny budget för skolan. "
+    "Budgeten ger skolan tre miljarder kronor mer nästa år. "
+    "Oppositionen kritiserar budgeten och kallar den otillräcklig. "
+    "Lärarförbundet välkomnar pengarna men vill se fler lärare. "
+    "Stockholm får den största delen av de nya pengarna. "
+    "Beslutet väntas klubbas i riksdagen i december. "
+    "Polisen utreder samtidigt en brand på en skola i Göteborg.",
+    
+    "Elpriset stiger i hela landet. Elpriset stiger i hela landet. "
+    "Stormen slog ut elen i norr. Elpriset stiger i hela landet. "
+    "Stormen slog ut elen i norr. Regeringen lovar stöd till hushållen.",
+    
+    "Alfa beta gamma. Delta epsilon zeta. Eta theta iota. Kappa lambda my.",
+    
+    "Bara en mening här.",
+]
+
+
+def _parse(text):
+    from sumy.parsers.plaintext import PlaintextParser
+    return PlaintextParser.from_string(text, _RegexTokenizer()).document
+
+
+def _make_lexrank(configured):
+    from sumy.nlp.stemmers import Stemmer
+    from sumy.summarizers.lex_rank import LexRankSummarizer
+    
+    if not configured:
+        # As used by SumySummaryGenerator
+        return LexRankSummarizer()
+    lexrank = LexRankSummarizer(Stemmer('swedish'))
+    lexrank.stop_words = ('i', 'en', 'och', 'av', 'de', 'den', 'på', 'till')
+    return lexrank
+
+
+class TestFastLexRank:
+    """_FastLexRank must pick the same sentences as sumy's LexRankSummarizer"""
+    
+    @pytest.mark.parametrize('text', DOCUMENTS, ids=['article', 'repeated', 'disjoint', 'single'])
+    @pytest.mark.parametrize('sentences_count', [1, 2, 3, 5])
+    @pytest.mark.parametrize('configured', [False, True], ids=['default', 'stemmed'])
+    def test_same_sentences_as_sumy(self, text, sentences_count, configured):
+        """Test that the NumPy similarity graph gives sumy's ranking, ties included"""
+        document = _parse(text)
+        expected = _make_lexrank(configured)(document, sentences_count)
+        actual = _FastLexRank(_make_lexrank(configured))(document, sentences_count)
+        assert [str(s) for s in actual] == [str(s) for s in expected]
+    
+    def test_empty_document(self):
+        """Test that a document without sentences gives an empty summary"""
+        from sumy.summarizers.lex_rank import LexRankSummarizer
+        assert _FastLexRank(LexRankSummarizer())(_parse(""), 3) == tuple()
+
+
+class _CharEncoding:
+    """Stand-in for a tiktoken encoding with one token per character."""
+    
+    def encode(self, text):
+        return [ord(c) for c in text]
+    
+    def decode(self, tokens):
+        return ''.join(chr(t) for t in tokens)
+
+
+class TestTrimToBudget:
+    """Test suite for _trim_to_budget, with and without tiktoken"""
+    
+    TEXT = "Första meningen är här. Andra meningen är också här! Tredje meningen blir avkortad"
+    
+    @pytest.fixture(params=['chars', 'tokens'])
+    def budget(self, request, monkeypatch):
+        """Return a function (limit) -> (max_tokens, max_chars) for the active mode"""
+        if request.param == 'chars':
+            # No tiktoken: the character budget applies
+            monkeypatch.setattr(summarizer, '_get_encoding', lambda model: None)
+            return lambda limit: (10 ** 6, limit)
+        monkeypatch.setattr(summarizer, '_get_encoding', lambda model: _CharEncoding())
+        return lambda limit: (limit, 10 ** 6)
+    
+    def test_short_text_unchanged(self, budget):
+        """Test that text within the budget is returned as is"""
+        assert _trim_to_budget(self.TEXT, *budget(len(self.TEXT)), 'gpt-4o-mini') == self.TEXT
+    
+    def test_cuts_at_sentence_boundary(self, budget):
+        """Test that the partial last sentence is dropped"""
+        result = _trim_to_budget(self.TEXT, *budget(70), 'gpt-4o-mini')
+        assert result == "Första meningen är här. Andra meningen är också här!"
+    
+    def test_cut_exactly_after_sentence_end(self, budget):
+        """Test that a budget ending right after a terminator keeps that sentence"""
+        limit = len("Första meningen är här. Andra meningen är också här!")
+        result = _trim_to_budget(self.TEXT, *budget(limit), 'gpt-4o-mini')
+        assert result == "Första meningen är här. Andra meningen är också här!"
+    
+    def test_ellipsis_when_no_sentence_fits(self, budget):
+        """Test that "..." is appended when no sentence boundary is in the kept text"""
+        result = _trim_to_budget(self.TEXT, *budget(15), 'gpt-4o-mini')
+        assert result == "Första meningen..."
+    
+    def test_ellipsis_when_boundary_too_early(self, budget):
+        """Test that a cut discarding most of the text falls back to "..." instead"""
+        text = "Kort. " + "ord " * 40
+        result = _trim_to_budget(text, *budget(60), 'gpt-4o-mini')
+        assert result == text[:60] + "..."
+
+
+class TestSumySummarize:
+    """Test suite for SumySummaryGenerator.summarize"""
+    
+    @pytest.fixture
+    def generator(self, monkeypatch):
+        """A fresh generator using the regex tokenizer instead of NLTK Punkt"""
+        monkeypatch.setattr(summarizer, '_get_tokenizer', lambda language: _RegexTokenizer())
+        return summarizer.SumySummaryGenerator(language='sv')
+    
+    def test_short_text_is_cleaned(self, generator):
+        """Test that text short enough to return whole still has dates, URLs and e-mail removed"""
+        text = (
+            "2025 12 08\n"
+            "Regeringen presenterade en ny budget för skolan på måndagen. "
+            "Läs mer på https://example.se/artikel.html om hela beslutet. "
+            "Frågor om artikeln skickas till red@example.se som vanligt."
+        )
+        summary = generator.summarize(text, max_sentences=4)
+        assert summary.startswith("Regeringen presenterade")
+        for noise in ("2025 12 08", "https://example.se/artikel.html", "red@example.se"):
+            assert noise not in summary
@@ -0,0 +1,161 @@
+"""
+Unit tests for the text helpers in newsbot.translation
+"""
+import os
+import sys
+from unittest.mock import Mock
+
+import pytest
+
+# translation imports its sibling modules by name, so newsbot itself goes on the path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'newsbot')))
+
+import translation
+from translation import TRANSLATE_ATTEMPTS, normalize_whitespace, split_for_translation, translate_with_retry
+
+
+# Whitespace that str.split() treats specially: tabs, newlines, NBSP, the \x1c-\x1f
+# separators, other Unicode spaces, and leading/trailing runs
+WHITESPACE_TEXTS = [
+    "",
+    " ",
+    "ord",
+    "redan normaliserad text",
+    "  inledande och avslutande  ",
+    "tabb\there\tand\t\tmore",
+    "rad\nbrytning\r\noch\vmer\f",
+    "hårt\u00a0mellanslag och\u00a0\u00a0två",
+    "fil\x1cgrupp\x1dpost\x1eenhet\x1fslut",
+    "\x1c\x1d\x1e\x1f",
+    "em\u2003space\u2028line\u3000ideographic",
+    "\t\n leading mix",
+    "trailing mix \u00a0\x1f\n",
+    "slutar med ett mellanslag ",
+    "a  b",
+    "সরকার\u00a0নতুন  বাজেট",
+]
+
+# Latin and Bangla sentences, paragraph breaks, and a long run with no break at all
+SPLIT_TEXTS = [
+    "Regeringen presenterade budgeten. Oppositionen kritiserade den! Vad händer nu? " * 20,
+    "সরকার নতুন বাজেট পেশ করেছে। বিরোধী দল সমালোচনা করেছে। " * 20,
+    "Första stycket har en mening.\n\nAndra stycket har också en mening.\n\n" * 10,
+    "ord " * 200,
+    "x" * 500,
+    "Kort text.",
+    "",
+]
+
+
+class TestSplitForTranslation:
+    """Test suite for split_for_translation"""
+    
+    @pytest.mark.parametrize('text', SPLIT_TEXTS)
+    @pytest.mark.parametrize('limit', [40, 100, 333])
+    def test_chunks_within_limit(self, text, limit):
+        """Test that no piece is longer than the limit"""
+        assert all(0 < len(chunk) <= limit for chunk in split_for_translation(text, limit))
+    
+    @pytest.mark.parametrize('text', SPLIT_TEXTS)
+    @pytest.mark.parametrize('limit', [40, 100, 333])
+    def test_round_trip(self, text, limit):
+        """Test that joining the pieces gives back the original text"""
+        assert ''.join(split_for_translation(text, limit)) == text
+    
+    def test_short_text_single_chunk(self):
+        """Test that text within the limit is returned as one piece"""
+        assert split_for_translation("Kort text.", 100) == ["Kort text."]
+    
+    def test_empty_text(self):
+        """Test that empty text gives no pieces"""
+        assert split_for_translation("", 100) == []
+    
+    def test_prefers_sentence_end_over_space(self):
+        """Test that the cut is made after the last sentence end, not the last space"""
+        text = "Första meningen är ganska lång. Andra meningen fortsätter här och blir för lång"
+        chunks = split_for_translation(text, 60)
+        assert chunks[0] == "Första meningen är ganska lång. "
+    
+    def test_prefers_bangla_sentence_end(self):
+        """Test that the Bangla full stop (daari) counts as a sentence end"""
+        text = "সরকার নতুন বাজেট পেশ করেছে। বিরোধী দল এই বাজেটের তীব্র সমালোচনা করেছে"
+        chunks = split_for_translation(text, 50)
+        assert chunks[0] == "সরকার নতুন বাজেট পেশ করেছে। "
+    
+    def test_prefers_paragraph_break_over_sentence_end(self):
+        """Test that a paragraph break wins over a later sentence end"""
+        text = "Första stycket slutar just här.\n\nAndra stycket. Det fortsätter ett tag till utan slut"
+        chunks = split_for_translation(text, 60)
+        assert chunks[0] == "Första stycket slutar just här.\n\n"
+    
+    def test_early_sentence_end_falls_back_to_space(self):
+        """Test that a sentence end in the first half of a piece is skipped for the last space"""
+        text = "Kort. " + "ord " * 30
+        chunks = split_for_translation(text, 62)
+        assert chunks[0] == text[:62]
+    
+    def test_hard_cut_without_spaces(self):
+        """Test that text without any break is cut at the limit"""
+        assert split_for_translation("x" * 25, 10) == ["x" * 10, "x" * 10, "x" * 5]
+
+
+class TestNormalizeWhitespace:
+    """Test suite for normalize_whitespace"""
+    
+    @pytest.mark.parametrize('text', WHITESPACE_TEXTS)
+    def test_matches_split_join(self, text):
+        """Test that the result equals ' '.join(text.split())"""
+        assert normalize_whitespace(text) == ' '.join(text.split())
+    
+    def test_normalized_text_returned_as_is(self):
+        """Test that already-normalized text comes back as the same object"""
+        text = "redan normaliserad text"
+        assert normalize_whitespace(text) is text
+
+
+class TestTranslateWithRetry:
+    """Test suite for translate_with_retry (backoff sleeps are recorded, not slept)"""
+    
+    @pytest.fixture
+    def sleeps(self, monkeypatch):
+        """Record the backoff delays; jitter is pinned to zero"""
+        calls = []
+        monkeypatch.setattr(translation.time, 'sleep', calls.append)
+        monkeypatch.setattr(translation.random, 'random', lambda: 0.0)
+        return calls
+    
+    def test_success_first_attempt(self, sleeps):
+        """Test that a successful call returns at once without sleeping"""
+        translator = Mock()
+        translator.translate.return_value = Mock(text="হ্যালো")
+        assert translate_with_retry(translator, "Hej", 'bn') == "হ্যালো"
+        translator.translate.assert_called_once_with("Hej", dest='bn')
+        assert sleeps == []
+    
+    @pytest.mark.parametrize('error', [ConnectionError("Network error"), TimeoutError("Request timeout")])
+    def test_transient_error_then_success(self, sleeps, error):
+        """Test that a transient failure is retried after the first backoff step"""
+        translator = Mock()
+        translator.translate.side_effect = [error, Mock(text="হ্যালো")]
+        assert translate_with_retry(translator, "Hej", 'bn') == "হ্যালো"
+        assert translator.translate.call_count == 2
+        assert sleeps == [0.2]
+    
+    @pytest.mark.parametrize('error', [ConnectionError("Network error"), TimeoutError("Request timeout")])
+    def test_transient_error_every_attempt(self, sleeps, error):
+        """Test that the last error is raised once every attempt has failed"""
+        translator = Mock()
+        translator.translate.side_effect = error
+        with pytest.raises(type(error)):
+            translate_with_retry(translator, "Hej", 'bn')
+        assert translator.translate.call_count == TRANSLATE_ATTEMPTS
+        assert sleeps == [0.2 * 2 ** attempt for attempt in range(TRANSLATE_ATTEMPTS - 1)]
+    
+    def test_other_error_not_retried(self, sleeps):
+        """Test that a non-transient error fails on the first attempt"""
+        translator = Mock()
+        translator.translate.side_effect = ValueError("bad response")
+        with pytest.raises(ValueError):
+            translate_with_retry(translator, "Hej", 'bn')
+        translator.translate.assert_called_once()
+        assert sleeps == []